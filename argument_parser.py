@@ -26,6 +26,7 @@ def parse_arguments(argstring):
     config.ENABLE_NO_Z_SAFE20 = False
     config.USE_G0 = False
     config.USE_Z_PART = False
+    utils.refresh_config()
     
     if not argstring:
         return {}
@@ -162,6 +163,9 @@ def parse_arguments(argstring):
     print(f"[WoodWOP]   USE_G0 = {config.USE_G0}")
     print(f"[WoodWOP]   USE_Z_PART = {config.USE_Z_PART}")
     
+    # Apply the parsed flags to values cached in utils (debug_log)
+    utils.refresh_config()
+    
     return {}
 
 
@@ -110,6 +110,7 @@ ENABLE_NO_Z_SAFE20 = False
 USE_G0 = False  # If False: G0 chains at start/end of trajectory are skipped
 USE_Z_PART = False  # If True: Use Z coordinates from Job without correction
 ENABLE_FREECAD_CONSOLE_LOG = False  # If True: log all FreeCAD Console output to file
+EMIT_ARC_MIDPOINT = True  # If False: skip arc midpoint (x2, y2) calculation in contour elements
 
 # Tracking state
 contour_counter = 1
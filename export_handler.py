@@ -95,8 +95,11 @@ def export_path_commands(objectslist, output_filename):
         output_lines.append("=" * 80)
         
         # Write to file
-        with open(output_filename, 'w', encoding='utf-8', newline='\n') as f:
-            f.write('\n'.join(output_lines))
+        with open(output_filename, 'w', encoding='utf-8', newline='\n', buffering=1 << 17) as f:
+            # Newline between lines only (none after the last), as with '\n'.join()
+            lines = iter(output_lines)
+            f.write(next(lines, ''))
+            f.writelines('\n' + line for line in lines)
         
         print(f"[WoodWOP] Path commands exported to: {output_filename}")
         print(f"[WoodWOP]   Operations: {operation_count}, Commands: {total_commands}")
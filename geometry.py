@@ -43,9 +43,9 @@ def calculate_part_minimum():
         
         # Check all elements in contour
         for elem_idx, elem in enumerate(contour.get('elements', [])):
-            x = elem.get('x', 0.0)
-            y = elem.get('y', 0.0)
-            z = elem.get('z', 0.0)
+            x = elem.x
+            y = elem.y
+            z = elem.z
             
             # Check end point
             if min_x is None or x < min_x:
@@ -57,9 +57,9 @@ def calculate_part_minimum():
             points_checked += 1
             
             # For arcs, also check center point (I, J are relative to previous point)
-            if elem.get('type') == 'KA':  # Arc element
-                center_x = prev_x + elem.get('i', 0.0)
-                center_y = prev_y + elem.get('j', 0.0)
+            if elem.type == 'KA':  # Arc element
+                center_x = prev_x + elem.i
+                center_y = prev_y + elem.j
                 center_z = prev_z  # Arc center Z is same as previous Z for XY plane arcs
                 
                 # Check center point
@@ -73,7 +73,7 @@ def calculate_part_minimum():
                 
                 # For arcs, also check if radius extends beyond end point
                 # Calculate arc extent (center ± radius)
-                radius = elem.get('r', 0.0)
+                radius = elem.r
                 if radius > 0.001:
                     # Check X extent
                     arc_min_x = center_x - radius
@@ -161,9 +161,9 @@ def calculate_part_bounds():
         
         # Check all elements in contour
         for elem_idx, elem in enumerate(contour.get('elements', [])):
-            x = elem.get('x', 0.0)
-            y = elem.get('y', 0.0)
-            z = elem.get('z', 0.0)
+            x = elem.x
+            y = elem.y
+            z = elem.z
             
             # Check end point
             if min_x is None or x < min_x:
@@ -181,9 +181,9 @@ def calculate_part_bounds():
             points_checked += 1
             
             # For arcs, also check center point and arc extent
-            if elem.get('type') == 'KA':  # Arc element
-                center_x = prev_x + elem.get('i', 0.0)
-                center_y = prev_y + elem.get('j', 0.0)
+            if elem.type == 'KA':  # Arc element
+                center_x = prev_x + elem.i
+                center_y = prev_y + elem.j
                 center_z = prev_z  # Arc center Z is same as previous Z for XY plane arcs
                 
                 # Check center point
@@ -203,7 +203,7 @@ def calculate_part_bounds():
                 
                 # For arcs, also check if radius extends beyond end point
                 # Calculate arc extent (center ± radius)
-                radius = elem.get('r', 0.0)
+                radius = elem.r
                 if radius > 0.001:
                     # Check X and Y extents
                     arc_min_x = center_x - radius
@@ -283,12 +283,12 @@ def determine_tool_compensation(contour_id):
     # Calculate average X position of contour elements
     x_positions = []
     for elem in contour['elements']:
-        if elem['type'] == 'KL':  # Line
-            x_positions.append(elem['x'])
-        elif elem['type'] == 'KA':  # Arc
-            x_positions.append(elem['x'])
-        elif elem['type'] == 'KP':  # Point
-            x_positions.append(elem['x'])
+        if elem.type == 'KL':  # Line
+            x_positions.append(elem.x)
+        elif elem.type == 'KA':  # Arc
+            x_positions.append(elem.x)
+        elif elem.type == 'KP':  # Point
+            x_positions.append(elem.x)
     
     if not x_positions:
         return "NoWRK"
@@ -7,12 +7,6 @@ from . import config
 from . import path_parser
 from . import geometry
 
-# Try to import FreeCAD Path utilities
-try:
-    import PathScripts.PathUtils as PathUtils
-except ImportError:
-    PathUtils = None
-
 
 def process_path_object(obj):
     """
@@ -110,30 +104,16 @@ def get_operation_type(obj):
         elif 'pocket' in obj_type:
             return 'pocket'
 
-    # Fallback: analyze path commands
+    # Fallback: analyze path commands (cached, reused by the path extractors)
     if hasattr(obj, 'Path'):
-        try:
-            if PathUtils is None:
-                path_commands = obj.Path.Commands if hasattr(obj.Path, 'Commands') else []
-            else:
-                path_commands = PathUtils.getPathWithPlacement(obj).Commands
-            has_arcs = any(cmd.Name in ['G2', 'G02', 'G3', 'G03'] for cmd in path_commands)
-            has_drilling = any(cmd.Name in ['G81', 'G82', 'G83'] for cmd in path_commands)
-
-            if has_drilling:
-                return 'drilling'
-            elif has_arcs:
-                return 'profile'
-        except:
-            # Fallback to direct Path access
-            if hasattr(obj.Path, 'Commands'):
-                has_arcs = any(cmd.Name in ['G2', 'G02', 'G3', 'G03'] for cmd in obj.Path.Commands)
-                has_drilling = any(cmd.Name in ['G81', 'G82', 'G83'] for cmd in obj.Path.Commands)
-
-                if has_drilling:
-                    return 'drilling'
-                elif has_arcs:
-                    return 'profile'
+        path_commands = path_parser.get_path_commands(obj)
+        has_arcs = any(cmd.Name in ['G2', 'G02', 'G3', 'G03'] for cmd in path_commands)
+        has_drilling = any(cmd.Name in ['G81', 'G82', 'G83'] for cmd in path_commands)
+
+        if has_drilling:
+            return 'drilling'
+        elif has_arcs:
+            return 'profile'
 
     return 'contour'
 
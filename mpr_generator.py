@@ -209,19 +209,19 @@ def generate_mpr_content(z_safe=20.0):
             elem_num = idx + 1
             output.append(f'$E{elem_num}')
 
-            if elem['type'] == 'KL':  # Line
+            if elem.type == 'KL':  # Line
                 # Original coordinates (before offset) for Path Commands
-                orig_x = elem['x']
-                orig_y = elem['y']
-                orig_z = elem.get('z', 0.0)
+                orig_x = elem.x
+                orig_y = elem.y
+                orig_z = elem.z
                 
-                elem_x = elem['x'] + config.COORDINATE_OFFSET_X
-                elem_y = elem['y'] + config.COORDINATE_OFFSET_Y
+                elem_x = elem.x + config.COORDINATE_OFFSET_X
+                elem_y = elem.y + config.COORDINATE_OFFSET_Y
                 # Apply Z offset only if USE_Z_PART is False
                 if config.USE_Z_PART:
-                    z_value = elem.get('z', 0.0)  # Use Z from Job without offset
+                    z_value = elem.z  # Use Z from Job without offset
                 else:
-                    z_value = elem.get('z', 0.0) + config.COORDINATE_OFFSET_Z
+                    z_value = elem.z + config.COORDINATE_OFFSET_Z
                 
                 output.append('KL ')
                 output.append(f'X={utils.fmt(elem_x)}')
@@ -252,7 +252,7 @@ def generate_mpr_content(z_safe=20.0):
 
                 # Processing analysis output
                 if config.ENABLE_PROCESSING_ANALYSIS:
-                    move_type = elem.get('move_type', 'G1')
+                    move_type = elem.move_type or 'G1'
                     line_length = math.sqrt(dx*dx + dy*dy + dz*dz)
                     path_cmd = f"{move_type} X={orig_x} Y={orig_y} Z={orig_z}"
                     analysis = f"l={line_length:.6f} r1= r2= angle="
@@ -268,24 +268,24 @@ def generate_mpr_content(z_safe=20.0):
                 prev_elem_y_orig = orig_y
                 prev_elem_z_orig = orig_z
 
-            elif elem['type'] == 'KA':  # Arc
+            elif elem.type == 'KA':  # Arc
                 # Original coordinates (before offset) for center calculation
-                orig_x = elem['x']
-                orig_y = elem['y']
-                orig_z = elem.get('z', 0.0)
+                orig_x = elem.x
+                orig_y = elem.y
+                orig_z = elem.z
                 
                 # Offset coordinates for output
-                elem_x = elem['x'] + config.COORDINATE_OFFSET_X
-                elem_y = elem['y'] + config.COORDINATE_OFFSET_Y
+                elem_x = elem.x + config.COORDINATE_OFFSET_X
+                elem_y = elem.y + config.COORDINATE_OFFSET_Y
                 # Apply Z offset only if USE_Z_PART is False
                 if config.USE_Z_PART:
-                    z_value = elem.get('z', 0.0)  # Use Z from Job without offset
+                    z_value = elem.z  # Use Z from Job without offset
                 else:
-                    z_value = elem.get('z', 0.0) + config.COORDINATE_OFFSET_Z
+                    z_value = elem.z + config.COORDINATE_OFFSET_Z
                 
                 # CRITICAL: Calculate arc center from I, J offsets using ORIGINAL (unoffset) coordinates
-                center_x_orig = prev_elem_x_orig + elem.get('i', 0)
-                center_y_orig = prev_elem_y_orig + elem.get('j', 0)
+                center_x_orig = prev_elem_x_orig + elem.i
+                center_y_orig = prev_elem_y_orig + elem.j
                 
                 # Apply offset to center coordinates for output
                 center_x = center_x_orig + config.COORDINATE_OFFSET_X
@@ -295,7 +295,7 @@ def generate_mpr_content(z_safe=20.0):
                 start_angle = math.atan2(prev_elem_y - center_y, prev_elem_x - center_x)
                 end_angle = math.atan2(elem_y - center_y, elem_x - center_x)
                 
-                direction = elem.get('direction', 'CW')
+                direction = elem.direction
                 
                 # Normalize angles based on direction
                 if direction == 'CCW' and end_angle < start_angle:
@@ -312,7 +312,7 @@ def generate_mpr_content(z_safe=20.0):
                 radius_to_end = math.sqrt((elem_x - center_x)**2 + (elem_y - center_y)**2)
                 
                 # Get radius from element
-                initial_radius = elem.get('r', 0.0)
+                initial_radius = elem.r
                 if initial_radius <= 0.001:
                     initial_radius = (radius_from_start + radius_to_end) / 2.0
                 
@@ -555,8 +555,11 @@ def generate_mpr_content(z_safe=20.0):
                 pass
             
             analysis_filename = os.path.join(output_dir, f"{base_filename}_processing_analysis.txt")
-            with open(analysis_filename, 'w', encoding='utf-8', newline='\n') as f:
-                f.write('\n'.join(analysis_lines))
+            with open(analysis_filename, 'w', encoding='utf-8', newline='\n', buffering=1 << 17) as f:
+                # Newline between lines only (none after the last), as with '\n'.join()
+                lines = iter(analysis_lines)
+                f.write(next(lines, ''))
+                f.writelines('\n' + line for line in lines)
             print(f"[WoodWOP] Processing analysis exported to: {analysis_filename}")
         except Exception as e:
             print(f"[WoodWOP ERROR] Failed to write processing analysis file: {e}")
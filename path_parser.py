@@ -7,29 +7,249 @@ import math
 from . import config
 from . import utils
 
-# Try to import FreeCAD Path utilities
-try:
-    import PathScripts.PathUtils as PathUtils
-except ImportError:
-    PathUtils = None
+# G-code command names grouped by movement type
+_G0_NAMES = frozenset(('G0', 'G00'))
+_G1_NAMES = frozenset(('G1', 'G01'))
+_ARC_CW = frozenset(('G2', 'G02'))
+_ARC_CCW = frozenset(('G3', 'G03'))
+_ARC_NAMES = _ARC_CW | _ARC_CCW
+_WORKING_NAMES = _G1_NAMES | _ARC_NAMES
+_DRILL_NAMES = frozenset(('G81', 'G82', 'G83'))
+
+# Command categories: one dict lookup per command instead of several set tests
+_CAT_G0 = 0
+_CAT_G1 = 1
+_CAT_ARC_CW = 2
+_CAT_ARC_CCW = 3
+_CAT_DRILL = 4
+_CAT_OTHER = -1
+_CAT = {}
+_CAT.update(dict.fromkeys(_G0_NAMES, _CAT_G0))
+_CAT.update(dict.fromkeys(_G1_NAMES, _CAT_G1))
+_CAT.update(dict.fromkeys(_ARC_CW, _CAT_ARC_CW))
+_CAT.update(dict.fromkeys(_ARC_CCW, _CAT_ARC_CCW))
+_CAT.update(dict.fromkeys(_DRILL_NAMES, _CAT_DRILL))
+
+# Arc discretization: segments per radian of sweep (~5 degrees per segment)
+_SEG_PER_RAD = 180.0 / math.pi / 5.0
+
+# Movement tolerance (0.001 mm), squared for distance tests
+_EPS_SQ = 1e-3 * 1e-3
+
+# FreeCAD Path utilities, imported on first use (see _get_path_utils)
+_path_utils = None
+_path_utils_tried = False
+
+# Placed Path commands cached per object during one export: id(obj) -> (obj, commands)
+_commands_cache = {}
+
+
+class ContourElement:
+    """
+    Contour element (line 'KL' or arc 'KA') extracted from Path commands.
+    
+    Uses __slots__ instead of a per-element dict. Fields that do not apply
+    to the element type (e.g. arc data on a line) are None.
+    """
+
+    __slots__ = ('type', 'x', 'y', 'z', 'i', 'j', 'x2', 'y2', 'r', 'direction', 'move_type')
+
+    def __init__(self, type, x, y, z, i=None, j=None, x2=None, y2=None, r=None,
+                 direction=None, move_type=None):
+        self.type = type
+        self.x = x
+        self.y = y
+        self.z = z
+        self.i = i  # Center offset in X (from start point)
+        self.j = j  # Center offset in Y (from start point)
+        self.x2 = x2  # Intermediate point X (for three-point format)
+        self.y2 = y2  # Intermediate point Y (for three-point format)
+        self.r = r
+        self.direction = direction
+        self.move_type = move_type  # Original movement type ('G0'/'G1') for analysis
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__
+                           if getattr(self, name) is not None)
+        return f"ContourElement({fields})"
+
+
+def _discretize_arc_loop(center_x, center_y, radius, start_angle, end_angle, start_z, end_z,
+                         num_segments, xs, ys, zs):
+    """
+    Discretize an arc into line segment end points with linear Z interpolation.
+    
+    Args:
+        center_x, center_y: Arc center
+        radius: Arc radius
+        start_angle, end_angle: Normalized start and end angles (radians)
+        start_z, end_z: Z at arc start and end
+        num_segments: Number of line segments
+        xs, ys, zs: Output lists of num_segments items, filled with the end point of each segment
+    """
+    for seg in range(num_segments):
+        t = (seg + 1) / num_segments
+        angle = start_angle + (end_angle - start_angle) * t
+        xs[seg] = center_x + radius * math.cos(angle)
+        ys[seg] = center_y + radius * math.sin(angle)
+        zs[seg] = start_z + (end_z - start_z) * t
 
 
-def extract_contour_from_path(obj):
+def _discretize_arc(center_x, center_y, radius, start_angle, end_angle, start_z, end_z, num_segments):
+    """
+    Discretize an arc into line segment end points with linear Z interpolation.
+    
+    Args:
+        Same as _discretize_arc_loop(), without the output buffers
+        
+    Returns:
+        tuple: (xs, ys, zs) lists with the end point of each segment
+    """
+    xs = [0.0] * num_segments
+    ys = [0.0] * num_segments
+    zs = [0.0] * num_segments
+    _discretize_arc_loop(center_x, center_y, radius, start_angle, end_angle, start_z, end_z,
+                         num_segments, xs, ys, zs)
+    return xs, ys, zs
+
+
+def _get_path_utils():
+    """
+    Import FreeCAD Path utilities on first use.
+    
+    Returns:
+        module: PathScripts.PathUtils, or None if not available
+    """
+    global _path_utils, _path_utils_tried
+    if not _path_utils_tried:
+        _path_utils_tried = True
+        try:
+            import PathScripts.PathUtils as PathUtils
+            _path_utils = PathUtils
+        except ImportError:
+            _path_utils = None
+    return _path_utils
+
+
+def get_path_commands(obj):
+    """
+    Get Path commands with placement transformation applied.
+    
+    The result of PathUtils.getPathWithPlacement() is cached per object, so
+    several extractors working on the same object transform its path only once.
+    The cache lives for one export (see clear_cache()).
+    
+    Args:
+        obj: FreeCAD Path object (must have a Path attribute)
+        
+    Returns:
+        list: Path commands
+    """
+    key = id(obj)
+    entry = _commands_cache.get(key)
+    if entry is not None and entry[0] is obj:
+        return entry[1]
+
+    # Use PathUtils.getPathWithPlacement to get commands with placement transformation
+    PathUtils = _get_path_utils()
+    if PathUtils is None:
+        path_commands = obj.Path.Commands if hasattr(obj.Path, 'Commands') else []
+    else:
+        try:
+            path_commands = PathUtils.getPathWithPlacement(obj).Commands
+        except:
+            path_commands = obj.Path.Commands if hasattr(obj.Path, 'Commands') else []
+
+    _commands_cache[key] = (obj, path_commands)
+    return path_commands
+
+
+def clear_cache():
+    """
+    Clear cached Path commands. Called at the start and end of each export.
+    """
+    _commands_cache.clear()
+
+
+def extract_contour_from_path(obj, out=None):
     """
     Extract contour elements (points, lines, arcs) from Path commands.
     
     Args:
         obj: FreeCAD Path object
+        out: Optional list to fill with the elements (cleared first), so callers
+             processing many objects can reuse one list. The returned list is
+             out itself, and job_processor keeps it in config.contours, so reusing
+             one out for several stored contours overwrites the earlier ones
         
     Returns:
         tuple: (elements, start_pos) where elements is a list of contour elements
-               and start_pos is (x, y, z) tuple
+               (out, if given) and start_pos is (x, y, z) tuple
     """
+    elements = out if out is not None else []
+    elements.clear()
+
+    if not hasattr(obj, 'Path'):
+        return elements, (0.0, 0.0, 0.0)
+
+    path_commands = get_path_commands(obj)
+    if not path_commands:
+        return elements, (0.0, 0.0, 0.0)
+
+    start_pos = _extract_contour(path_commands, elements)
+    return elements, start_pos
+
+
+def extract_drilling_operations(obj, get_tool_number_func):
+    """
+    Extract drilling positions from Path object.
+    
+    Args:
+        obj: FreeCAD Path object
+        get_tool_number_func: Function to get tool number from object
+        
+    Returns:
+        list: List of drilling operations
+    """
+    tool_number = get_tool_number_func(obj) if get_tool_number_func else None
+
+    if not hasattr(obj, 'Path'):
+        return []
+
+    path_commands = get_path_commands(obj)
+    if not path_commands:
+        return []
+
+    return _extract_drilling(path_commands, tool_number)
+
+
+def _extract_contour(path_commands, elements):
+    """
+    Build contour elements from Path commands in a single pass.
+    
+    Args:
+        path_commands: List of Path commands (non-empty)
+        elements: List to append the contour elements to
+        
+    Returns:
+        tuple: start_pos (x, y, z) as in extract_contour_from_path()
+    """
+    # Evaluate debug messages only when verbose logging is enabled
+    debug = config.ENABLE_VERBOSE_LOGGING
+
+    # Local bindings for math functions used in the arc branches
+    cos = math.cos
+    sin = math.sin
+    atan2 = math.atan2
+    hypot = math.hypot
+    pi = math.pi
+    emit_midpoint = config.EMIT_ARC_MIDPOINT
+
     # Log USE_G0 flag value at start of extraction
     print(f"[WoodWOP] extract_contour_from_path(): USE_G0 = {config.USE_G0}")
-    utils.debug_log(f"[WoodWOP DEBUG] extract_contour_from_path(): USE_G0 = {config.USE_G0}")
+    if debug:
+        utils.debug_log(f"[WoodWOP DEBUG] extract_contour_from_path(): USE_G0 = {config.USE_G0}")
     
-    elements = []
     current_x = 0.0
     current_y = 0.0
     current_z = 0.0
@@ -42,109 +262,105 @@ def extract_contour_from_path(obj):
     # Track last position before first working element (for start_pos calculation)
     last_pos_before_first_working = None
 
-    if not hasattr(obj, 'Path'):
-        return elements, (0.0, 0.0, 0.0)
-
-    # Use PathUtils.getPathWithPlacement to get commands with placement transformation
-    if PathUtils is None:
-        path_commands = obj.Path.Commands if hasattr(obj.Path, 'Commands') else []
-    else:
-        try:
-            path_commands = PathUtils.getPathWithPlacement(obj).Commands
-        except:
-            path_commands = obj.Path.Commands if hasattr(obj.Path, 'Commands') else []
-    
-    if not path_commands:
-        return elements, (0.0, 0.0, 0.0)
-
-    # If USE_G0 is False, find first and last "working" elements (G1/G2/G3)
-    # G0 chains before first and after last working elements will be skipped
+    # If USE_G0 is False, G0 chains before the first and after the last "working"
+    # element (G1/G2/G3) are skipped. Both boundaries are resolved in a single pass:
+    # G0 lines before the first working element are buffered in pending_leading_g0
+    # (kept only if no working element follows), G0 lines after a working element
+    # are buffered in trailing_g0 (committed when the next working element arrives).
     first_working_idx = None
     last_working_idx = None
-    
-    if not config.USE_G0:
-        # First pass: find indices of first and last working elements
-        for idx, cmd in enumerate(path_commands):
-            if cmd.Name in ['G1', 'G01', 'G2', 'G02', 'G3', 'G03']:
-                if first_working_idx is None:
-                    first_working_idx = idx
-                last_working_idx = idx
-        print(f"[WoodWOP] USE_G0=False: first_working_idx={first_working_idx}, last_working_idx={last_working_idx}")
-        utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: first_working_idx={first_working_idx}, last_working_idx={last_working_idx}")
-    else:
+    pending_leading_g0 = []
+    trailing_g0 = []
+
+    if config.USE_G0:
         print(f"[WoodWOP] USE_G0=True: All G0 commands will be processed as G1 (linear moves)")
-        utils.debug_log(f"[WoodWOP DEBUG] USE_G0=True: All G0 commands will be processed as G1 (linear moves)")
+        if debug:
+            utils.debug_log(f"[WoodWOP DEBUG] USE_G0=True: All G0 commands will be processed as G1 (linear moves)")
 
-    # Second pass: process commands
     print(f"[WoodWOP] Processing {len(path_commands)} commands")
-    g0_count = sum(1 for cmd in path_commands if cmd.Name in ['G0', 'G00'])
-    g1_count = sum(1 for cmd in path_commands if cmd.Name in ['G1', 'G01'])
-    g2_count = sum(1 for cmd in path_commands if cmd.Name in ['G2', 'G02'])
-    g3_count = sum(1 for cmd in path_commands if cmd.Name in ['G3', 'G03'])
-    print(f"[WoodWOP] Command counts: G0={g0_count}, G1={g1_count}, G2={g2_count}, G3={g3_count}")
-    
-    # Debug: Show all commands with indices and G0 positions
-    if config.ENABLE_VERBOSE_LOGGING:
-        print(f"[WoodWOP DEBUG] All commands:")
-        for idx, cmd in enumerate(path_commands):
-            cmd_name = cmd.Name
-            params = cmd.Parameters
-            x = params.get('X', 'N/A')
-            y = params.get('Y', 'N/A')
-            z = params.get('Z', 'N/A')
-            is_g0 = cmd_name in ['G0', 'G00']
-            is_working = cmd_name in ['G1', 'G01', 'G2', 'G02', 'G3', 'G03']
-            status = ""
-            if not config.USE_G0 and first_working_idx is not None and last_working_idx is not None:
-                if is_g0:
-                    if idx < first_working_idx:
-                        status = " [SKIP: before first working]"
-                    elif idx > last_working_idx:
-                        status = " [SKIP: after last working]"
-                    else:
-                        status = " [PROCESS: between working]"
-                elif is_working:
-                    status = " [WORKING]"
-            print(f"[WoodWOP DEBUG]   [{idx}] {cmd_name}: X={x}, Y={y}, Z={z}{status}")
-    
+    g0_count = 0
+    g1_count = 0
+    g2_count = 0
+    g3_count = 0
+
+    append_element = elements.append
     for idx, cmd in enumerate(path_commands):
+        cat = _CAT.get(cmd.Name, _CAT_OTHER)
+        if cat == _CAT_OTHER or cat == _CAT_DRILL:
+            # Not a move: does not change the contour position
+            continue
+
+        # Read Parameters once: on FreeCAD commands it is a property that
+        # builds a new dict on every access
         params = cmd.Parameters
 
-        # Update position
-        x = params.get('X', current_x)
-        y = params.get('Y', current_y)
-        z = params.get('Z', current_z)
+        # Position after this command
+        x = params['X'] if 'X' in params else current_x
+        y = params['Y'] if 'Y' in params else current_y
+        z = params['Z'] if 'Z' in params else current_z
+        dx = x - current_x
+        dy = y - current_y
+        dz = z - current_z
+        zero_move = dx * dx + dy * dy + dz * dz < _EPS_SQ
+
+        if cat == _CAT_G0:
+            g0_count += 1
+        elif cat == _CAT_G1:
+            g1_count += 1
+        elif cat == _CAT_ARC_CW:
+            g2_count += 1
+        elif cat == _CAT_ARC_CCW:
+            g3_count += 1
+
+        # Working element (G1/G2/G3): resolve buffered G0 chains
+        if _CAT_G1 <= cat <= _CAT_ARC_CCW:
+            if first_working_idx is None:
+                first_working_idx = idx
+                for g0_idx, _ in pending_leading_g0:
+                    # Before first working element - SKIP (WoodWOP handles approach)
+                    print(f"[WoodWOP] G0 ПРОПУЩЕН [index {g0_idx}]: до первого рабочего элемента (первый рабочий на индексе {idx}) - WoodWOP обрабатывает подход автоматически")
+                    if debug:
+                        utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Skipping G0 chain at start (WoodWOP handles approach)")
+                pending_leading_g0 = []
+            for g0_idx, g0_elem in trailing_g0:
+                # Between working elements - PROCESS as G1
+                append_element(g0_elem)
+                print(f"[WoodWOP] G0 ОБРАБОТАН [index {g0_idx}]: между рабочими элементами, обрабатывается как G1")
+                if debug:
+                    utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Processing G0 between working elements as G1")
+            trailing_g0 = []
+            last_working_idx = idx
 
         # ============================================================
         # CRITICAL: G0 (rapid move) processing
         # ============================================================
-        if cmd.Name in ['G0', 'G00']:
+        if cat == _CAT_G0:
             # Calculate movement
-            dx = abs(x - current_x)
-            dy = abs(y - current_y)
-            dz = abs(z - current_z)
+            dx = abs(dx)
+            dy = abs(dy)
+            dz = abs(dz)
             
             print(f"[WoodWOP] Found G0 at index {idx}: X={x:.3f}, Y={y:.3f}, Z={z:.3f}, dx={dx:.3f}, dy={dy:.3f}, dz={dz:.3f}")
             
             # Skip zero movements
-            if dx < 0.001 and dy < 0.001 and dz < 0.001:
+            if zero_move:
                 print(f"[WoodWOP] G0 ПРОПУЩЕН [index {idx}]: нулевое перемещение (dx={dx:.6f}, dy={dy:.6f}, dz={dz:.6f})")
-                utils.debug_log(f"[WoodWOP DEBUG] G0 skipped at index {idx} (zero movement)")
+                if debug:
+                    utils.debug_log(f"[WoodWOP DEBUG] G0 skipped at index {idx} (zero movement)")
                 current_x = x
                 current_y = y
                 current_z = z
                 continue
             
-            # CRITICAL DECISION: Process or skip G0?
-            should_process_g0 = False
-            skip_reason = None
-            
+            # Create line element for G0
+            line_elem = ContourElement('KL', x, y, z, move_type='G0')  # Line
+
             if config.USE_G0:
                 # USE_G0=True: Process ALL G0 as G1
-                should_process_g0 = True
                 print(f"[WoodWOP] G0 ОБРАБОТАН [index {idx}]: USE_G0=True, все G0 обрабатываются как G1")
-                utils.debug_log(f"[WoodWOP DEBUG] USE_G0=True: Processing G0 at index {idx} as G1")
-                
+                if debug:
+                    utils.debug_log(f"[WoodWOP DEBUG] USE_G0=True: Processing G0 at index {idx} as G1")
+
                 # Set start position from the START of the FIRST G0 command (before it moves)
                 # X, Y: initial position of first G0 (before it moves)
                 # Z: expression "th+z_safe" (WoodWOP will calculate it)
@@ -153,47 +369,22 @@ def extract_contour_from_path(obj):
                     start_y = current_y
                     start_z = "th+z_safe"  # Expression string, WoodWOP will calculate
                     print(f"[WoodWOP] Start position set from start of first G0: X={start_x:.3f}, Y={start_y:.3f}, Z={start_z}")
-                    utils.debug_log(f"[WoodWOP DEBUG] Start position set from start of first G0: ({start_x:.3f}, {start_y:.3f}, Z={start_z})")
-            else:
-                # USE_G0=False: Skip G0 CHAINS at start/end, process G0 BETWEEN working elements
-                if first_working_idx is not None and idx < first_working_idx:
-                    # Before first working element - SKIP (WoodWOP handles approach)
-                    should_process_g0 = False
-                    skip_reason = f"до первого рабочего элемента (первый рабочий на индексе {first_working_idx})"
-                    print(f"[WoodWOP] G0 ПРОПУЩЕН [index {idx}]: {skip_reason} - WoodWOP обрабатывает подход автоматически")
-                    utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Skipping G0 chain at start (WoodWOP handles approach)")
-                elif last_working_idx is not None and idx > last_working_idx:
-                    # After last working element - SKIP (WoodWOP handles retract)
-                    should_process_g0 = False
-                    skip_reason = f"после последнего рабочего элемента (последний рабочий на индексе {last_working_idx})"
-                    print(f"[WoodWOP] G0 ПРОПУЩЕН [index {idx}]: {skip_reason} - WoodWOP обрабатывает отвод автоматически")
-                    utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Skipping G0 chain at end (WoodWOP handles retract)")
-                else:
-                    # Between working elements OR no working elements - PROCESS as G1
-                    should_process_g0 = True
-                    if first_working_idx is None and last_working_idx is None:
-                        print(f"[WoodWOP] G0 ОБРАБОТАН [index {idx}]: нет рабочих элементов, обрабатывается как G1")
-                        utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Processing G0 (no working elements)")
-                    else:
-                        print(f"[WoodWOP] G0 ОБРАБОТАН [index {idx}]: между рабочими элементами, обрабатывается как G1")
-                        utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Processing G0 between working elements as G1")
-            
-            if should_process_g0:
-                # Create line element for G0
-                line_elem = {
-                    'type': 'KL',  # Line
-                    'x': x,
-                    'y': y,
-                    'z': z,
-                    'move_type': 'G0'  # Store original movement type for analysis
-                }
-                elements.append(line_elem)
+                    if debug:
+                        utils.debug_log(f"[WoodWOP DEBUG] Start position set from start of first G0: ({start_x:.3f}, {start_y:.3f}, Z={start_z})")
+
+                append_element(line_elem)
                 print(f"[WoodWOP] G0 добавлен в контур [index {idx}]: X={x:.3f}, Y={y:.3f}, Z={z:.3f}, всего элементов={len(elements)}")
-                utils.debug_log(f"[WoodWOP DEBUG] Added G0 element as G1: total elements={len(elements)}")
+                if debug:
+                    utils.debug_log(f"[WoodWOP DEBUG] Added G0 element as G1: total elements={len(elements)}")
+            elif not found_first_working:
+                # USE_G0=False: before first working element - decided once a working
+                # element is found (skipped) or the path ends without one (processed)
+                pending_leading_g0.append((idx, line_elem))
             else:
-                # G0 was skipped - only position updated (message already printed above)
-                utils.debug_log(f"[WoodWOP DEBUG] G0 skipped at index {idx}, position updated but not added to contour")
-            
+                # USE_G0=False: after a working element - committed only if another
+                # working element follows, otherwise skipped as part of the end chain
+                trailing_g0.append((idx, line_elem))
+
             # Update current position (regardless of whether G0 was processed)
             current_x = x
             current_y = y
@@ -207,7 +398,7 @@ def extract_contour_from_path(obj):
             continue  # Important: skip to next command
 
         # Linear move (G1) - create line
-        elif cmd.Name in ['G1', 'G01']:
+        elif cat == _CAT_G1:
             # ============================================================
             # Mark first working element (for start_pos)
             # ============================================================
@@ -221,35 +412,25 @@ def extract_contour_from_path(obj):
                     if last_pos_before_first_working is not None:
                         start_x, start_y, start_z = last_pos_before_first_working
                         print(f"[WoodWOP] Start position set from last G0: X={start_x:.3f}, Y={start_y:.3f}, Z={start_z:.3f}")
-                        utils.debug_log(f"[WoodWOP DEBUG] Start position set from last G0: ({start_x:.3f}, {start_y:.3f}, {start_z:.3f})")
+                        if debug:
+                            utils.debug_log(f"[WoodWOP DEBUG] Start position set from last G0: ({start_x:.3f}, {start_y:.3f}, {start_z:.3f})")
                     elif start_x is None:
                         # Fallback: use current position if no G0 was processed
                         start_x = current_x
                         start_y = current_y
                         start_z = current_z
                         print(f"[WoodWOP] Start position set to current position (no preceding G0): X={start_x:.3f}, Y={start_y:.3f}, Z={start_z:.3f}")
-                        utils.debug_log(f"[WoodWOP DEBUG] Start position set to current position (no preceding G0): ({start_x:.3f}, {start_y:.3f}, {start_z:.3f})")
+                        if debug:
+                            utils.debug_log(f"[WoodWOP DEBUG] Start position set to current position (no preceding G0): ({start_x:.3f}, {start_y:.3f}, {start_z:.3f})")
                 # When USE_G0=True, start_pos is already set from first G0, don't overwrite it
             # Check if there is actual movement (dX, dY, or dZ)
-            # Skip if all movements are less than 0.001 (no actual movement)
-            dx = abs(x - current_x)
-            dy = abs(y - current_y)
-            dz = abs(z - current_z)
-            if not (dx < 0.001 and dy < 0.001 and dz < 0.001):
-                line_elem = {
-                    'type': 'KL',  # Line
-                    'x': x,
-                    'y': y,
-                    'z': z,  # Always include Z coordinate
-                    'move_type': 'G1'  # Store original movement type for analysis
-                }
-                elements.append(line_elem)
-            current_x = x
-            current_y = y
-            current_z = z
+            # Skip if the move is shorter than 0.001 (no actual movement)
+            if not zero_move:
+                line_elem = ContourElement('KL', x, y, z, move_type='G1')  # Line
+                append_element(line_elem)
 
         # Arc move (G2, G3) - create arc
-        elif cmd.Name in ['G2', 'G02', 'G3', 'G03']:
+        elif cat == _CAT_ARC_CW or cat == _CAT_ARC_CCW:
             # ============================================================
             # Mark first working element (for start_pos)
             # ============================================================
@@ -261,99 +442,123 @@ def extract_contour_from_path(obj):
                 if last_pos_before_first_working is not None:
                     start_x, start_y, start_z = last_pos_before_first_working
                     print(f"[WoodWOP] Start position set from last G0: X={start_x:.3f}, Y={start_y:.3f}, Z={start_z:.3f}")
-                    utils.debug_log(f"[WoodWOP DEBUG] Start position set from last G0: ({start_x:.3f}, {start_y:.3f}, {start_z:.3f})")
+                    if debug:
+                        utils.debug_log(f"[WoodWOP DEBUG] Start position set from last G0: ({start_x:.3f}, {start_y:.3f}, {start_z:.3f})")
                 elif start_x is None:
                     # Fallback: use current position if no G0 was processed
                     start_x = current_x
                     start_y = current_y
                     start_z = current_z
             
-            i = params.get('I', 0)
-            j = params.get('J', 0)
-            direction = 'CW' if cmd.Name in ['G2', 'G02'] else 'CCW'
+            i = params['I'] if 'I' in params else 0
+            j = params['J'] if 'J' in params else 0
+            direction = 'CW' if cat == _CAT_ARC_CW else 'CCW'
 
             # WoodWOP limitation: arcs do not support Z-axis changes
             # If Z changes during arc, we must convert to line segments
-            z_changes = abs(z - current_z) > 0.001
+            z_delta = z - current_z
+            z_changes = z_delta * z_delta > _EPS_SQ
+
+            # Center (I, J are offsets from start point) and radius
+            center_x = current_x + i
+            center_y = current_y + j
+            radius = hypot(i, j)
 
             if z_changes:
                 # Convert arc with Z change to line segments
-                # Calculate center point
-                center_x = current_x + i
-                center_y = current_y + j
-                radius = math.sqrt(i*i + j*j) if (i != 0 or j != 0) else 0
-
-                # Discretize arc into line segments
                 # Calculate start and end angles
-                start_angle = math.atan2(current_y - center_y, current_x - center_x)
-                end_angle = math.atan2(y - center_y, x - center_x)
+                start_angle = atan2(current_y - center_y, current_x - center_x)
+                end_angle = atan2(y - center_y, x - center_x)
 
                 # Normalize angles
                 if direction == 'CCW' and end_angle < start_angle:
-                    end_angle += 2 * math.pi
+                    end_angle += 2 * pi
                 elif direction == 'CW' and end_angle > start_angle:
-                    end_angle -= 2 * math.pi
+                    end_angle -= 2 * pi
 
                 # Number of segments (more segments = smoother curve)
-                num_segments = max(8, int(abs(end_angle - start_angle) * 180 / math.pi / 5))  # ~5 degrees per segment
-
-                for seg in range(1, num_segments + 1):
-                    t = seg / num_segments
-                    angle = start_angle + (end_angle - start_angle) * t
-                    seg_x = center_x + radius * math.cos(angle)
-                    seg_y = center_y + radius * math.sin(angle)
-                    seg_z = current_z + (z - current_z) * t
-
-                    line_elem = {
-                        'type': 'KL',  # Line
-                        'x': seg_x,
-                        'y': seg_y,
-                        'z': seg_z
-                    }
-                    elements.append(line_elem)
-                # Update position after arc with Z change (converted to segments)
-                current_x = x
-                current_y = y
-                current_z = z
+                num_segments = max(8, int(abs(end_angle - start_angle) * _SEG_PER_RAD))
+
+                seg_xs, seg_ys, seg_zs = _discretize_arc(center_x, center_y, radius,
+                                                         start_angle, end_angle,
+                                                         current_z, z, num_segments)
+                # Segment count is known up front: fill a preallocated list
+                segments = [None] * num_segments
+                for seg, (seg_x, seg_y, seg_z) in enumerate(zip(seg_xs, seg_ys, seg_zs)):
+                    segments[seg] = ContourElement('KL', seg_x, seg_y, seg_z)  # Line
+                elements.extend(segments)
             else:
                 # Normal arc in XY plane - no Z change
-                # Calculate center point (I, J are offsets from start point)
-                center_x = current_x + i
-                center_y = current_y + j
-                radius = math.sqrt(i*i + j*j) if (i != 0 or j != 0) else 0
-
                 # Calculate intermediate point for three-point arc format (X2, Y2)
-                # Use midpoint of arc as intermediate point
-                start_angle = math.atan2(current_y - center_y, current_x - center_x)
-                end_angle = math.atan2(y - center_y, x - center_x)
-                
-                # Normalize angles for direction
-                if direction == 'CCW' and end_angle < start_angle:
-                    end_angle += 2 * math.pi
-                elif direction == 'CW' and end_angle > start_angle:
-                    end_angle -= 2 * math.pi
-                
-                mid_angle = (start_angle + end_angle) / 2
-                mid_x = center_x + radius * math.cos(mid_angle)
-                mid_y = center_y + radius * math.sin(mid_angle)
-
-                arc_elem = {
-                    'type': 'KA',  # Arc
-                    'x': x,  # End point X
-                    'y': y,  # End point Y
-                    'i': i,  # Center offset in X (from start point)
-                    'j': j,  # Center offset in Y (from start point)
-                    'x2': mid_x,  # Intermediate point X (for three-point format)
-                    'y2': mid_y,  # Intermediate point Y (for three-point format)
-                    'r': radius,
-                    'direction': direction,
-                    'z': z  # Always include Z coordinate
-                }
-                elements.append(arc_elem)
-                # Update position after arc
-                current_x = x
-                current_y = y
-                current_z = z
+                # Use midpoint of arc as intermediate point (skipped if not emitted)
+                mid_x = None
+                mid_y = None
+                if emit_midpoint:
+                    start_angle = atan2(current_y - center_y, current_x - center_x)
+                    end_angle = atan2(y - center_y, x - center_x)
+
+                    # Normalize angles for direction
+                    if direction == 'CCW' and end_angle < start_angle:
+                        end_angle += 2 * pi
+                    elif direction == 'CW' and end_angle > start_angle:
+                        end_angle -= 2 * pi
+
+                    mid_angle = (start_angle + end_angle) / 2
+                    mid_x = center_x + radius * cos(mid_angle)
+                    mid_y = center_y + radius * sin(mid_angle)
+
+                arc_elem = ContourElement('KA', x, y, z, i=i, j=j, x2=mid_x, y2=mid_y,  # Arc
+                                          r=radius, direction=direction)
+                append_element(arc_elem)
+
+        # Update position after the working move
+        current_x = x
+        current_y = y
+        current_z = z
+
+    # Resolve G0 chains still buffered at the end of the path (USE_G0=False)
+    if first_working_idx is None:
+        for g0_idx, g0_elem in pending_leading_g0:
+            # No working elements - PROCESS as G1
+            elements.append(g0_elem)
+            print(f"[WoodWOP] G0 ОБРАБОТАН [index {g0_idx}]: нет рабочих элементов, обрабатывается как G1")
+            if debug:
+                utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Processing G0 (no working elements)")
+    for g0_idx, _ in trailing_g0:
+        # After last working element - SKIP (WoodWOP handles retract)
+        print(f"[WoodWOP] G0 ПРОПУЩЕН [index {g0_idx}]: после последнего рабочего элемента (последний рабочий на индексе {last_working_idx}) - WoodWOP обрабатывает отвод автоматически")
+        if debug:
+            utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: Skipping G0 chain at end (WoodWOP handles retract)")
+
+    if not config.USE_G0:
+        print(f"[WoodWOP] USE_G0=False: first_working_idx={first_working_idx}, last_working_idx={last_working_idx}")
+        if debug:
+            utils.debug_log(f"[WoodWOP DEBUG] USE_G0=False: first_working_idx={first_working_idx}, last_working_idx={last_working_idx}")
+    print(f"[WoodWOP] Command counts: G0={g0_count}, G1={g1_count}, G2={g2_count}, G3={g3_count}")
+
+    # Debug: Show all commands with indices and G0 positions
+    if debug:
+        print(f"[WoodWOP DEBUG] All commands:")
+        for idx, cmd in enumerate(path_commands):
+            cmd_name = cmd.Name
+            params = cmd.Parameters
+            x = params.get('X', 'N/A')
+            y = params.get('Y', 'N/A')
+            z = params.get('Z', 'N/A')
+            is_g0 = cmd_name in _G0_NAMES
+            is_working = cmd_name in _WORKING_NAMES
+            status = ""
+            if not config.USE_G0 and first_working_idx is not None and last_working_idx is not None:
+                if is_g0:
+                    if idx < first_working_idx:
+                        status = " [SKIP: before first working]"
+                    elif idx > last_working_idx:
+                        status = " [SKIP: after last working]"
+                    else:
+                        status = " [PROCESS: between working]"
+                elif is_working:
+                    status = " [WORKING]"
+            print(f"[WoodWOP DEBUG]   [{idx}] {cmd_name}: X={x}, Y={y}, Z={z}{status}")
 
     # Return elements and start position
     # Preserve string expressions (e.g., "th+z_safe") for start_z
@@ -367,85 +572,63 @@ def extract_contour_from_path(obj):
                      start_z if start_z is not None else 0.0)
     
     # Debug: Count G0 elements
-    g0_count = sum(1 for elem in elements if elem.get('move_type') == 'G0')
-    print(f"[WoodWOP] extract_contour_from_path() completed: total elements={len(elements)}, G0 elements={g0_count}, USE_G0={config.USE_G0}")
-    utils.debug_log(f"[WoodWOP DEBUG] extract_contour_from_path() completed: total elements={len(elements)}, G0 elements={g0_count}, USE_G0={config.USE_G0}")
+    g0_elem_count = sum(1 for elem in elements if elem.move_type == 'G0')
+    print(f"[WoodWOP] extract_contour_from_path() completed: total elements={len(elements)}, G0 elements={g0_elem_count}, USE_G0={config.USE_G0}")
+    if debug:
+        utils.debug_log(f"[WoodWOP DEBUG] extract_contour_from_path() completed: total elements={len(elements)}, G0 elements={g0_elem_count}, USE_G0={config.USE_G0}")
     
-    return elements, start_pos
+    return start_pos
 
 
-def extract_drilling_operations(obj, get_tool_number_func):
+def _extract_drilling(path_commands, tool_number):
     """
-    Extract drilling positions from Path object.
+    Build drilling operations from Path commands.
     
     Args:
-        obj: FreeCAD Path object
-        get_tool_number_func: Function to get tool number from object
+        path_commands: List of Path commands (non-empty)
+        tool_number: Tool number for the operations
         
     Returns:
         list: List of drilling operations
     """
     drilling_ops = []
-    tool_number = get_tool_number_func(obj) if get_tool_number_func else None
-
-    if not hasattr(obj, 'Path'):
-        return drilling_ops
-
-    # Use PathUtils.getPathWithPlacement to get commands with placement transformation
-    if PathUtils is None:
-        path_commands = obj.Path.Commands if hasattr(obj.Path, 'Commands') else []
-    else:
-        try:
-            path_commands = PathUtils.getPathWithPlacement(obj).Commands
-        except:
-            path_commands = obj.Path.Commands if hasattr(obj.Path, 'Commands') else []
-
-    if not path_commands:
-        return drilling_ops
-
-    # Collect drilling positions
-    drill_positions = []
+    add_drilling_op = drilling_ops.append
     current_x = 0.0
     current_y = 0.0
     current_z = 0.0
-    depth = 10.0
 
     for cmd in path_commands:
-        params = cmd.Parameters
+        cat = _CAT.get(cmd.Name, _CAT_OTHER)
 
-        if cmd.Name in ['G81', 'G82', 'G83']:  # Drilling cycles
-            x = params.get('X', current_x)
-            y = params.get('Y', current_y)
-            z = params.get('Z', current_z)
-            r = params.get('R', 0)  # Retract height
+        if cat == _CAT_DRILL:  # Drilling cycles
+            params = cmd.Parameters
+            x = params['X'] if 'X' in params else current_x
+            y = params['Y'] if 'Y' in params else current_y
+            z = params['Z'] if 'Z' in params else current_z
+            r = params['R'] if 'R' in params else 0  # Retract height
 
             drill_depth = abs(z - r) if r != 0 else abs(z)
 
-            drill_positions.append({
-                'x': x,
-                'y': y,
-                'depth': drill_depth
+            # Create BohrVert (vertical drilling) operation for this position
+            add_drilling_op({
+                'type': 'BohrVert',
+                'id': 102,
+                'xa': x,
+                'ya': y,
+                'depth': drill_depth,
+                'tool': tool_number
             })
 
             current_x = x
             current_y = y
-            depth = drill_depth
-
-        elif cmd.Name in ['G0', 'G00', 'G1', 'G01']:
-            current_x = params.get('X', current_x)
-            current_y = params.get('Y', current_y)
-            current_z = params.get('Z', current_z)
-
-    # Create BohrVert (vertical drilling) operation for each position
-    for pos in drill_positions:
-        drilling_ops.append({
-            'type': 'BohrVert',
-            'id': 102,
-            'xa': pos['x'],
-            'ya': pos['y'],
-            'depth': pos['depth'],
-            'tool': tool_number
-        })
 
-    return drilling_ops
+        elif cat == _CAT_G0 or cat == _CAT_G1:
+            params = cmd.Parameters
+            if 'X' in params:
+                current_x = params['X']
+            if 'Y' in params:
+                current_y = params['Y']
+            if 'Z' in params:
+                current_z = params['Z']
 
+    return drilling_ops
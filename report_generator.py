@@ -3,12 +3,84 @@ Report generator module for WoodWOP Post Processor.
 Handles generation of job reports and analysis files.
 """
 
-import datetime
+import os
+
 from . import config
 from . import geometry
 from . import utils
 
 
+# Report section separators
+_HR = "-" * 80
+_HR2 = "=" * 80
+
+# Property values longer than this are truncated in the report
+_MAX_VALUE_LENGTH = 200
+_TRUNC_SUFFIX = "... (truncated)"
+
+# Sentinel for getattr() lookups where None is a valid attribute value
+_MISSING = object()
+
+
+def _getattr_any(obj, *names, default=0.0):
+    """
+    Get the first existing attribute out of several alternative names.
+    
+    Stops at the first hit, so later (fallback) names are only looked up
+    when the preferred ones are missing.
+    
+    Args:
+        obj: Object to read from
+        *names: Attribute names, in order of preference
+        default: Value returned if none of the attributes exists
+        
+    Returns:
+        Value of the first existing attribute, or default
+    """
+    for name in names:
+        value = getattr(obj, name, _MISSING)
+        if value is not _MISSING:
+            return value
+    return default
+
+
+def _truncate(text):
+    """Truncate very long property values to _MAX_VALUE_LENGTH characters."""
+    if len(text) > _MAX_VALUE_LENGTH:
+        return text[:_MAX_VALUE_LENGTH] + _TRUNC_SUFFIX
+    return text
+
+
+def _format_property_value(value):
+    """
+    Format a property value for the report based on its type.
+    
+    Values of unbounded length (lists, dicts, objects) are truncated to
+    _MAX_VALUE_LENGTH characters; None and quantities are always short.
+    
+    Args:
+        value: Property value (None, list/tuple, dict, Quantity, document object, ...)
+        
+    Returns:
+        str: Formatted value
+    """
+    if value is None:
+        return "None"
+    if isinstance(value, (list, tuple)):
+        items = ', '.join(map(str, value))
+        return _truncate(f"[{items}]")
+    if isinstance(value, dict):
+        items = ', '.join([f"{k}: {v}" for k, v in value.items()])
+        return _truncate(f"{{{items}}}")
+    quantity_value = getattr(value, 'Value', _MISSING)
+    if quantity_value is not _MISSING:
+        return f"{quantity_value} {getattr(value, 'Unit', '')}"
+    label = getattr(value, 'Label', _MISSING)
+    if label is not _MISSING:
+        return _truncate(f"{label} (Name: {getattr(value, 'Name', 'N/A')})")
+    return _truncate(str(value))
+
+
 def get_float_value(value):
     """
     Extract float value from Quantity object or return as-is if already float.
@@ -21,83 +93,117 @@ def get_float_value(value):
     """
     if value is None:
         return 0.0
-    if hasattr(value, 'Value'):
-        # If Value itself is a Quantity, recurse
-        val = value.Value
-        if hasattr(val, 'Value'):
-            return get_float_value(val)
-        return float(val)
-    return float(value)
+    val = getattr(value, 'Value', _MISSING)
+    if val is _MISSING:
+        return float(value)
+    # Value itself may be a Quantity (one level of nesting)
+    inner = getattr(val, 'Value', _MISSING)
+    return float(val if inner is _MISSING else inner)
+
+
+def _bbox_to_floats(bbox):
+    """
+    Read a bounding box as floats.
+    
+    Args:
+        bbox: FreeCAD BoundBox
+        
+    Returns:
+        tuple: (x_length, y_length, z_length, x_min, y_min, z_min, x_max, y_max, z_max)
+    """
+    return tuple(map(get_float_value, (bbox.XLength, bbox.YLength, bbox.ZLength,
+                                       bbox.XMin, bbox.YMin, bbox.ZMin,
+                                       bbox.XMax, bbox.YMax, bbox.ZMax)))
 
 
 def create_job_report(job, report_filename):
     """
     Create a detailed report of all Job properties.
     
+    The report is streamed line by line into a buffered temporary file,
+    which replaces report_filename only once the whole report is written.
+    
     Args:
         job: FreeCAD Job object
         report_filename: Path to output report file
     """
-    report_lines = []
-    report_lines.append("=" * 80)
-    report_lines.append("FreeCAD Path Job Properties Report")
-    report_lines.append("=" * 80)
-    report_lines.append(f"Generated: {datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    report_lines.append(f"Post Processor: WoodWOP MPR")
-    report_lines.append("")
+    tmp_filename = f"{report_filename}.tmp"
+    try:
+        with open(tmp_filename, 'w', encoding='utf-8', newline='\n', buffering=1 << 17) as f:
+            _write_job_report(job, f.write)
+        os.replace(tmp_filename, report_filename)
+    except OSError as e:
+        _remove_file(tmp_filename)
+        raise Exception(f"Failed to write report file: {e}")
+    except BaseException:
+        # Error while building the report: leave no partial file behind
+        _remove_file(tmp_filename)
+        raise
+
+
+def _remove_file(filename):
+    """Remove a file, ignoring errors (e.g. if it does not exist)."""
+    try:
+        os.remove(filename)
+    except OSError:
+        pass
+
+
+def _write_job_report(job, write):
+    """
+    Write the Job report line by line.
+    
+    Args:
+        job: FreeCAD Job object
+        write: Function writing a string to the report file
+    """
+    def add_line(line):
+        write(line)
+        write('\n')
+
+    add_line(_HR2)
+    add_line("FreeCAD Path Job Properties Report")
+    add_line(_HR2)
+    from datetime import datetime  # Only needed for the report timestamp
+    add_line(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    add_line(f"Post Processor: WoodWOP MPR")
+    add_line("")
     
     # Basic Job information
-    report_lines.append("-" * 80)
-    report_lines.append("BASIC INFORMATION")
-    report_lines.append("-" * 80)
+    add_line(_HR)
+    add_line("BASIC INFORMATION")
+    add_line(_HR)
     if hasattr(job, 'Label'):
-        report_lines.append(f"Label: {job.Label}")
+        add_line(f"Label: {job.Label}")
     if hasattr(job, 'Name'):
-        report_lines.append(f"Name: {job.Name}")
+        add_line(f"Name: {job.Name}")
     if hasattr(job, 'TypeId'):
-        report_lines.append(f"TypeId: {job.TypeId}")
-    report_lines.append("")
+        add_line(f"TypeId: {job.TypeId}")
+    add_line("")
     
     # All properties
-    report_lines.append("-" * 80)
-    report_lines.append("ALL PROPERTIES")
-    report_lines.append("-" * 80)
+    add_line(_HR)
+    add_line("ALL PROPERTIES")
+    add_line(_HR)
     
     if hasattr(job, 'PropertiesList'):
         for prop_name in sorted(job.PropertiesList):
             try:
                 prop_value = getattr(job, prop_name, None)
                 
-                # Format value based on type
-                if prop_value is None:
-                    value_str = "None"
-                elif isinstance(prop_value, (list, tuple)):
-                    value_str = f"[{', '.join(str(v) for v in prop_value)}]"
-                elif isinstance(prop_value, dict):
-                    value_str = f"{{{', '.join(f'{k}: {v}' for k, v in prop_value.items())}}}"
-                elif hasattr(prop_value, 'Value'):
-                    value_str = f"{prop_value.Value} {prop_value.Unit if hasattr(prop_value, 'Unit') else ''}"
-                elif hasattr(prop_value, 'Label'):
-                    value_str = f"{prop_value.Label} (Name: {prop_value.Name if hasattr(prop_value, 'Name') else 'N/A'})"
-                else:
-                    value_str = str(prop_value)
-                
-                # Truncate very long values
-                if len(value_str) > 200:
-                    value_str = value_str[:200] + "... (truncated)"
-                
-                report_lines.append(f"{prop_name}: {value_str}")
+                value_str = _format_property_value(prop_value)
+                add_line(f"{prop_name}: {value_str}")
             except Exception as e:
-                report_lines.append(f"{prop_name}: <Error reading property: {e}>")
+                add_line(f"{prop_name}: <Error reading property: {e}>")
     else:
-        report_lines.append("PropertiesList not available")
+        add_line("PropertiesList not available")
     
-    report_lines.append("")
+    add_line("")
     
     # Special properties of interest
-    report_lines.append("-" * 80)
-    report_lines.append("SPECIAL PROPERTIES OF INTEREST")
-    report_lines.append("-" * 80)
+    add_line(_HR)
+    add_line("SPECIAL PROPERTIES OF INTEREST")
+    add_line(_HR)
     
     special_props = [
         'PostProcessorOutputFile',
@@ -118,24 +224,25 @@ def create_job_report(job, report_filename):
                 prop_value = getattr(job, prop_name, None)
                 if prop_value is not None:
                     if hasattr(prop_value, 'Label'):
-                        report_lines.append(f"{prop_name}: {prop_value.Label} (Name: {prop_value.Name if hasattr(prop_value, 'Name') else 'N/A'})")
+                        name = getattr(prop_value, 'Name', 'N/A')
+                        add_line(f"{prop_name}: {prop_value.Label} (Name: {name})")
                     elif isinstance(prop_value, (list, tuple)):
-                        report_lines.append(f"{prop_name}: List/Tuple with {len(prop_value)} items")
+                        add_line(f"{prop_name}: List/Tuple with {len(prop_value)} items")
                         for idx, item in enumerate(prop_value[:10]):
                             if hasattr(item, 'Label'):
-                                report_lines.append(f"  [{idx}]: {item.Label}")
+                                add_line(f"  [{idx}]: {item.Label}")
                             else:
-                                report_lines.append(f"  [{idx}]: {item}")
+                                add_line(f"  [{idx}]: {item}")
                         if len(prop_value) > 10:
-                            report_lines.append(f"  ... and {len(prop_value) - 10} more items")
+                            add_line(f"  ... and {len(prop_value) - 10} more items")
                     else:
-                        report_lines.append(f"{prop_name}: {prop_value}")
+                        add_line(f"{prop_name}: {prop_value}")
             except Exception as e:
-                report_lines.append(f"{prop_name}: <Error: {e}>")
+                add_line(f"{prop_name}: <Error: {e}>")
         else:
-            report_lines.append(f"{prop_name}: <Not found>")
+            add_line(f"{prop_name}: <Not found>")
     
-    report_lines.append("")
+    add_line("")
     
     # Stock information
     stock_extent_x_neg = 0.0
@@ -146,9 +253,9 @@ def create_job_report(job, report_filename):
     stock_extent_z_pos = 0.0
     
     if hasattr(job, 'Stock') and job.Stock:
-        report_lines.append("-" * 80)
-        report_lines.append("STOCK INFORMATION")
-        report_lines.append("-" * 80)
+        add_line(_HR)
+        add_line("STOCK INFORMATION")
+        add_line(_HR)
         stock = job.Stock
         if hasattr(stock, 'PropertiesList'):
             for prop_name in sorted(stock.PropertiesList):
@@ -156,28 +263,23 @@ def create_job_report(job, report_filename):
                     prop_value = getattr(stock, prop_name, None)
                     if prop_value is not None:
                         if hasattr(prop_value, 'Value'):
-                            value_str = f"{prop_value.Value} {prop_value.Unit if hasattr(prop_value, 'Unit') else ''}"
+                            unit = getattr(prop_value, 'Unit', '')
+                            value_str = f"{prop_value.Value} {unit}"
                         else:
                             value_str = str(prop_value)
-                        report_lines.append(f"Stock.{prop_name}: {value_str}")
+                        add_line(f"Stock.{prop_name}: {value_str}")
                 except Exception as e:
-                    report_lines.append(f"Stock.{prop_name}: <Error: {e}>")
+                    add_line(f"Stock.{prop_name}: <Error: {e}>")
         
-        # Extract stock extents
-        if hasattr(stock, 'ExtentXNeg') or hasattr(stock, 'ExtXneg'):
-            stock_extent_x_neg = getattr(stock, 'ExtentXNeg', getattr(stock, 'ExtXneg', None))
-        if hasattr(stock, 'ExtentXPos') or hasattr(stock, 'ExtXpos'):
-            stock_extent_x_pos = getattr(stock, 'ExtentXPos', getattr(stock, 'ExtXpos', None))
-        if hasattr(stock, 'ExtentYNeg') or hasattr(stock, 'ExtYneg'):
-            stock_extent_y_neg = getattr(stock, 'ExtentYNeg', getattr(stock, 'ExtYneg', None))
-        if hasattr(stock, 'ExtentYPos') or hasattr(stock, 'ExtYpos'):
-            stock_extent_y_pos = getattr(stock, 'ExtentYPos', getattr(stock, 'ExtYpos', None))
-        if hasattr(stock, 'ExtentZNeg') or hasattr(stock, 'ExtZneg'):
-            stock_extent_z_neg = getattr(stock, 'ExtentZNeg', getattr(stock, 'ExtZneg', None))
-        if hasattr(stock, 'ExtentZPos') or hasattr(stock, 'ExtZpos'):
-            stock_extent_z_pos = getattr(stock, 'ExtentZPos', getattr(stock, 'ExtZpos', None))
+        # Extract stock extents (property names differ between FreeCAD versions)
+        stock_extent_x_neg = _getattr_any(stock, 'ExtentXNeg', 'ExtXneg')
+        stock_extent_x_pos = _getattr_any(stock, 'ExtentXPos', 'ExtXpos')
+        stock_extent_y_neg = _getattr_any(stock, 'ExtentYNeg', 'ExtYneg')
+        stock_extent_y_pos = _getattr_any(stock, 'ExtentYPos', 'ExtYpos')
+        stock_extent_z_neg = _getattr_any(stock, 'ExtentZNeg', 'ExtZneg')
+        stock_extent_z_pos = _getattr_any(stock, 'ExtentZPos', 'ExtZpos')
     
-    report_lines.append("")
+    add_line("")
     
     # Convert all values to float
     workpiece_length_val = get_float_value(config.WORKPIECE_LENGTH)
@@ -192,31 +294,31 @@ def create_job_report(job, report_filename):
     stock_extent_z_pos = get_float_value(stock_extent_z_pos)
     
     # Workpiece dimensions and oversizes section
-    report_lines.append("-" * 80)
-    report_lines.append("WORKPIECE DIMENSIONS AND OVERSIZES")
-    report_lines.append("-" * 80)
-    report_lines.append(f"Workpiece Length (X): {workpiece_length_val:.3f} mm")
-    report_lines.append(f"Workpiece Width (Y):  {workpiece_width_val:.3f} mm")
-    report_lines.append(f"Workpiece Thickness (Z): {workpiece_thickness_val:.3f} mm")
-    report_lines.append("")
-    report_lines.append("Stock Oversizes (Material Allowances):")
-    report_lines.append(f"  X- (negative direction): {stock_extent_x_neg:.3f} mm")
-    report_lines.append(f"  X+ (positive direction): {stock_extent_x_pos:.3f} mm")
-    report_lines.append(f"  Y- (negative direction): {stock_extent_y_neg:.3f} mm")
-    report_lines.append(f"  Y+ (positive direction): {stock_extent_y_pos:.3f} mm")
-    report_lines.append(f"  Z- (negative direction): {stock_extent_z_neg:.3f} mm")
-    report_lines.append(f"  Z+ (positive direction): {stock_extent_z_pos:.3f} mm")
-    report_lines.append("")
-    report_lines.append("Total Stock Dimensions (Workpiece + Oversizes):")
-    report_lines.append(f"  Total Length (X): {workpiece_length_val + stock_extent_x_neg + stock_extent_x_pos:.3f} mm")
-    report_lines.append(f"  Total Width (Y):  {workpiece_length_val + stock_extent_y_neg + stock_extent_y_pos:.3f} mm")
-    report_lines.append(f"  Total Thickness (Z): {workpiece_thickness_val + stock_extent_z_neg + stock_extent_z_pos:.3f} mm")
-    report_lines.append("")
+    add_line(_HR)
+    add_line("WORKPIECE DIMENSIONS AND OVERSIZES")
+    add_line(_HR)
+    add_line(f"Workpiece Length (X): {workpiece_length_val:.3f} mm")
+    add_line(f"Workpiece Width (Y):  {workpiece_width_val:.3f} mm")
+    add_line(f"Workpiece Thickness (Z): {workpiece_thickness_val:.3f} mm")
+    add_line("")
+    add_line("Stock Oversizes (Material Allowances):")
+    add_line(f"  X- (negative direction): {stock_extent_x_neg:.3f} mm")
+    add_line(f"  X+ (positive direction): {stock_extent_x_pos:.3f} mm")
+    add_line(f"  Y- (negative direction): {stock_extent_y_neg:.3f} mm")
+    add_line(f"  Y+ (positive direction): {stock_extent_y_pos:.3f} mm")
+    add_line(f"  Z- (negative direction): {stock_extent_z_neg:.3f} mm")
+    add_line(f"  Z+ (positive direction): {stock_extent_z_pos:.3f} mm")
+    add_line("")
+    add_line("Total Stock Dimensions (Workpiece + Oversizes):")
+    add_line(f"  Total Length (X): {workpiece_length_val + stock_extent_x_neg + stock_extent_x_pos:.3f} mm")
+    add_line(f"  Total Width (Y):  {workpiece_length_val + stock_extent_y_neg + stock_extent_y_pos:.3f} mm")
+    add_line(f"  Total Thickness (Z): {workpiece_thickness_val + stock_extent_z_neg + stock_extent_z_pos:.3f} mm")
+    add_line("")
     
     # Part dimensions and edge positions
-    report_lines.append("-" * 80)
-    report_lines.append("PART DIMENSIONS AND EDGE POSITIONS (Relative to Job Coordinate System)")
-    report_lines.append("-" * 80)
+    add_line(_HR)
+    add_line("PART DIMENSIONS AND EDGE POSITIONS (Relative to Job Coordinate System)")
+    add_line(_HR)
     
     part_length = None
     part_width = None
@@ -232,30 +334,13 @@ def create_job_report(job, report_filename):
         # Try to get dimensions from Job.Model first
         if hasattr(job, 'Model') and job.Model:
             model_obj = job.Model
-            if hasattr(model_obj, 'Shape') and hasattr(model_obj.Shape, 'BoundBox'):
-                bbox = model_obj.Shape.BoundBox
-                part_length = get_float_value(bbox.XLength)
-                part_width = get_float_value(bbox.YLength)
-                part_height = get_float_value(bbox.ZLength)
-                min_x = get_float_value(bbox.XMin)
-                min_y = get_float_value(bbox.YMin)
-                min_z = get_float_value(bbox.ZMin)
-                max_x = get_float_value(bbox.XMax)
-                max_y = get_float_value(bbox.YMax)
-                max_z = get_float_value(bbox.ZMax)
-                report_lines.append("(Dimensions from Job.Model bounding box)")
-            elif hasattr(model_obj, 'BoundBox'):
-                bbox = model_obj.BoundBox
-                part_length = get_float_value(bbox.XLength)
-                part_width = get_float_value(bbox.YLength)
-                part_height = get_float_value(bbox.ZLength)
-                min_x = get_float_value(bbox.XMin)
-                min_y = get_float_value(bbox.YMin)
-                min_z = get_float_value(bbox.ZMin)
-                max_x = get_float_value(bbox.XMax)
-                max_y = get_float_value(bbox.YMax)
-                max_z = get_float_value(bbox.ZMax)
-                report_lines.append("(Dimensions from Job.Model bounding box)")
+            bbox = getattr(getattr(model_obj, 'Shape', None), 'BoundBox', None)
+            if bbox is None:
+                bbox = getattr(model_obj, 'BoundBox', None)
+            if bbox is not None:
+                (part_length, part_width, part_height,
+                 min_x, min_y, min_z, max_x, max_y, max_z) = _bbox_to_floats(bbox)
+                add_line("(Dimensions from Job.Model bounding box)")
         
         # If Model not available, try Base
         if part_length is None and hasattr(job, 'Base') and job.Base:
@@ -267,18 +352,11 @@ def create_job_report(job, report_filename):
                 else:
                     base_obj = None
                 
-                if base_obj and hasattr(base_obj, 'Shape') and hasattr(base_obj.Shape, 'BoundBox'):
-                    bbox = base_obj.Shape.BoundBox
-                    part_length = get_float_value(bbox.XLength)
-                    part_width = get_float_value(bbox.YLength)
-                    part_height = get_float_value(bbox.ZLength)
-                    min_x = get_float_value(bbox.XMin)
-                    min_y = get_float_value(bbox.YMin)
-                    min_z = get_float_value(bbox.ZMin)
-                    max_x = get_float_value(bbox.XMax)
-                    max_y = get_float_value(bbox.YMax)
-                    max_z = get_float_value(bbox.ZMax)
-                    report_lines.append("(Dimensions from Job.Base bounding box)")
+                bbox = getattr(getattr(base_obj, 'Shape', None), 'BoundBox', None) if base_obj else None
+                if bbox is not None:
+                    (part_length, part_width, part_height,
+                     min_x, min_y, min_z, max_x, max_y, max_z) = _bbox_to_floats(bbox)
+                    add_line("(Dimensions from Job.Base bounding box)")
             except Exception as e:
                 pass
         
@@ -295,86 +373,76 @@ def create_job_report(job, report_filename):
                 part_length = max_x - min_x
                 part_width = max_y - min_y
                 part_height = max_z - min_z
-                report_lines.append("(Dimensions calculated from contours - may be inaccurate)")
+                add_line("(Dimensions calculated from contours - may be inaccurate)")
             except Exception as e:
-                report_lines.append(f"<Error calculating part bounds from contours: {e}>")
+                add_line(f"<Error calculating part bounds from contours: {e}>")
         
         if part_length is not None:
-            report_lines.append(f"Part Length (X): {part_length:.3f} mm")
-            report_lines.append(f"Part Width (Y):  {part_width:.3f} mm")
-            report_lines.append(f"Part Height (Z): {part_height:.3f} mm")
-            report_lines.append("")
-            report_lines.append("Part Edge Positions (Job Coordinate System):")
-            report_lines.append(f"  X- (minimum X): {min_x:.3f} mm")
-            report_lines.append(f"  X+ (maximum X): {max_x:.3f} mm")
-            report_lines.append(f"  Y- (minimum Y): {min_y:.3f} mm")
-            report_lines.append(f"  Y+ (maximum Y): {max_y:.3f} mm")
-            report_lines.append(f"  Z- (minimum Z): {min_z:.3f} mm")
-            report_lines.append(f"  Z+ (maximum Z): {max_z:.3f} mm")
-            report_lines.append("")
-            report_lines.append("Part Bounding Box:")
-            report_lines.append(f"  From: ({min_x:.3f}, {min_y:.3f}, {min_z:.3f}) mm")
-            report_lines.append(f"  To:   ({max_x:.3f}, {max_y:.3f}, {max_z:.3f}) mm")
+            add_line(f"Part Length (X): {part_length:.3f} mm")
+            add_line(f"Part Width (Y):  {part_width:.3f} mm")
+            add_line(f"Part Height (Z): {part_height:.3f} mm")
+            add_line("")
+            add_line("Part Edge Positions (Job Coordinate System):")
+            add_line(f"  X- (minimum X): {min_x:.3f} mm")
+            add_line(f"  X+ (maximum X): {max_x:.3f} mm")
+            add_line(f"  Y- (minimum Y): {min_y:.3f} mm")
+            add_line(f"  Y+ (maximum Y): {max_y:.3f} mm")
+            add_line(f"  Z- (minimum Z): {min_z:.3f} mm")
+            add_line(f"  Z+ (maximum Z): {max_z:.3f} mm")
+            add_line("")
+            add_line("Part Bounding Box:")
+            add_line(f"  From: ({min_x:.3f}, {min_y:.3f}, {min_z:.3f}) mm")
+            add_line(f"  To:   ({max_x:.3f}, {max_y:.3f}, {max_z:.3f}) mm")
         else:
-            report_lines.append("<Could not determine part dimensions>")
+            add_line("<Could not determine part dimensions>")
     except Exception as e:
-        report_lines.append(f"<Error calculating part dimensions: {e}>")
+        add_line(f"<Error calculating part dimensions: {e}>")
         import traceback
-        report_lines.append(f"<Traceback: {traceback.format_exc()}>")
+        add_line(f"<Traceback: {traceback.format_exc()}>")
     
-    report_lines.append("")
+    add_line("")
     
     # G54 Coordinate System Offset
-    report_lines.append("-" * 80)
-    report_lines.append("COORDINATE SYSTEM OFFSET (G54)")
-    report_lines.append("-" * 80)
+    add_line(_HR)
+    add_line("COORDINATE SYSTEM OFFSET (G54)")
+    add_line(_HR)
     if config.COORDINATE_SYSTEM:
         offset_x_val = get_float_value(config.COORDINATE_OFFSET_X)
         offset_y_val = get_float_value(config.COORDINATE_OFFSET_Y)
         offset_z_val = get_float_value(config.COORDINATE_OFFSET_Z)
         
-        report_lines.append(f"Coordinate System: {config.COORDINATE_SYSTEM}")
-        report_lines.append(f"Offset X: {offset_x_val:.3f} mm")
-        report_lines.append(f"Offset Y: {offset_y_val:.3f} mm")
-        report_lines.append(f"Offset Z: {offset_z_val:.3f} mm")
-        report_lines.append("")
-        report_lines.append("NOTE: This offset is applied ONLY to MPR format coordinates.")
-        report_lines.append("      G-code output remains unchanged (uses original Job coordinates).")
+        add_line(f"Coordinate System: {config.COORDINATE_SYSTEM}")
+        add_line(f"Offset X: {offset_x_val:.3f} mm")
+        add_line(f"Offset Y: {offset_y_val:.3f} mm")
+        add_line(f"Offset Z: {offset_z_val:.3f} mm")
+        add_line("")
+        add_line("NOTE: This offset is applied ONLY to MPR format coordinates.")
+        add_line("      G-code output remains unchanged (uses original Job coordinates).")
         if min_x is not None:
             min_x_val = get_float_value(min_x)
             min_y_val = get_float_value(min_y)
             min_z_val = get_float_value(min_z)
             
-            report_lines.append("")
-            report_lines.append("Part minimum point (before offset):")
-            report_lines.append(f"  X: {min_x_val:.3f} mm")
-            report_lines.append(f"  Y: {min_y_val:.3f} mm")
-            report_lines.append(f"  Z: {min_z_val:.3f} mm")
-            report_lines.append("")
-            report_lines.append("Part minimum point (after G54 offset, becomes 0,0,0 in MPR):")
-            report_lines.append(f"  X: {min_x_val + offset_x_val:.3f} mm (should be ~0.000)")
-            report_lines.append(f"  Y: {min_y_val + offset_y_val:.3f} mm (should be ~0.000)")
-            report_lines.append(f"  Z: {min_z_val + offset_z_val:.3f} mm (should be ~0.000)")
+            add_line("")
+            add_line("Part minimum point (before offset):")
+            add_line(f"  X: {min_x_val:.3f} mm")
+            add_line(f"  Y: {min_y_val:.3f} mm")
+            add_line(f"  Z: {min_z_val:.3f} mm")
+            add_line("")
+            add_line("Part minimum point (after G54 offset, becomes 0,0,0 in MPR):")
+            add_line(f"  X: {min_x_val + offset_x_val:.3f} mm (should be ~0.000)")
+            add_line(f"  Y: {min_y_val + offset_y_val:.3f} mm (should be ~0.000)")
+            add_line(f"  Z: {min_z_val + offset_z_val:.3f} mm (should be ~0.000)")
     else:
-        report_lines.append("Coordinate System: Project (no offset)")
-        report_lines.append("Offset X: 0.000 mm")
-        report_lines.append("Offset Y: 0.000 mm")
-        report_lines.append("Offset Z: 0.000 mm")
-        report_lines.append("")
-        report_lines.append("NOTE: No coordinate system offset is applied.")
-        report_lines.append("      MPR coordinates match Job coordinates.")
+        add_line("Coordinate System: Project (no offset)")
+        add_line("Offset X: 0.000 mm")
+        add_line("Offset Y: 0.000 mm")
+        add_line("Offset Z: 0.000 mm")
+        add_line("")
+        add_line("NOTE: No coordinate system offset is applied.")
+        add_line("      MPR coordinates match Job coordinates.")
     
-    report_lines.append("")
-    report_lines.append("=" * 80)
-    report_lines.append("End of Report")
-    report_lines.append("=" * 80)
-    
-    # Write report to file
-    try:
-        with open(report_filename, 'w', encoding='utf-8', newline='\n') as f:
-            f.write('\n'.join(report_lines))
-    except Exception as e:
-        raise Exception(f"Failed to write report file: {e}")
-
-
-
+    add_line("")
+    add_line(_HR2)
+    add_line("End of Report")
+    add_line(_HR2)
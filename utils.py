@@ -6,20 +6,44 @@ Contains helper functions for formatting, logging, etc.
 from . import config
 
 
-def debug_log(message):
-    """Print debug message only if verbose logging is enabled."""
-    if config.ENABLE_VERBOSE_LOGGING:
-        print(message)
-        try:
-            import FreeCAD
-            FreeCAD.Console.PrintMessage(message + "\n")
-        except:
-            pass
+def _debug_log_enabled(message):
+    """Print debug message (verbose logging enabled)."""
+    print(message)
+    try:
+        import FreeCAD
+        FreeCAD.Console.PrintMessage(message + "\n")
+    except:
+        pass
+
+
+def _debug_log_disabled(message):
+    """Ignore debug message (verbose logging disabled)."""
+
+
+# Print debug message only if verbose logging is enabled.
+# Bound to one of the variants above; rebound by refresh_config()
+debug_log = _debug_log_enabled if config.ENABLE_VERBOSE_LOGGING else _debug_log_disabled
+
+
+# Format spec for fmt(), e.g. '.3f' for PRECISION = 3; updated by refresh_config()
+_SPEC = f".{config.PRECISION}f"
+
+
+def refresh_config():
+    """
+    Re-read configuration values cached by this module.
+    
+    Must be called after config flags or PRECISION are changed at runtime
+    (done by argument_parser.parse_arguments()).
+    """
+    global debug_log, _SPEC
+    debug_log = _debug_log_enabled if config.ENABLE_VERBOSE_LOGGING else _debug_log_disabled
+    _SPEC = f".{config.PRECISION}f"
 
 
 def fmt(value):
-    """Format numeric value with precision."""
-    return f"{value:.{config.PRECISION}f}"
+    """Format numeric value with precision (config.PRECISION as of refresh_config())."""
+    return format(value, _SPEC)
 
 
 def fmt6(value):
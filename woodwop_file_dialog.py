@@ -4,6 +4,7 @@ This module provides a beautiful, modern file save dialog specifically for MPR f
 It handles different PySide versions and ensures .mpr extension is always used.
 """
 
+import functools
 import os
 
 # Try to import Qt modules (handle different versions)
@@ -12,18 +13,21 @@ QtGui = None
 QFileDialog = None
 QMessageBox = None
 
-def _import_qt_modules():
-    """Import Qt modules, trying different versions."""
-    global QtWidgets, QtGui, QFileDialog, QMessageBox
-    
-    if QFileDialog is not None:
-        return True
+
+@functools.cache
+def _load_qt_modules():
+    """
+    Import Qt modules once, trying different versions.
     
+    Returns:
+        tuple: (QtWidgets, QtGui, QFileDialog, QMessageBox), or None if no
+               PySide version is available
+    """
     # Try PySide6 first (newest)
     try:
         from PySide6.QtWidgets import QFileDialog, QMessageBox
         from PySide6 import QtGui, QtWidgets
-        return True
+        return QtWidgets, QtGui, QFileDialog, QMessageBox
     except ImportError:
         pass
     
@@ -31,7 +35,7 @@ def _import_qt_modules():
     try:
         from PySide2.QtWidgets import QFileDialog, QMessageBox
         from PySide2 import QtGui, QtWidgets
-        return True
+        return QtWidgets, QtGui, QFileDialog, QMessageBox
     except ImportError:
         pass
     
@@ -39,12 +43,20 @@ def _import_qt_modules():
     try:
         from PySide.QtGui import QFileDialog, QMessageBox
         import PySide.QtGui as QtGui
-        QtWidgets = QtGui
-        return True
+        return QtGui, QtGui, QFileDialog, QMessageBox
     except ImportError:
         pass
     
-    return False
+    return None
+
+
+def _import_qt_modules():
+    """Import Qt modules, trying different versions (result is cached, also on failure)."""
+    modules = _load_qt_modules()
+    if modules is None:
+        return False
+    globals().update(zip(('QtWidgets', 'QtGui', 'QFileDialog', 'QMessageBox'), modules))
+    return True
 
 
 def show_save_dialog(parent=None, default_filename="", default_directory=""):
@@ -8,107 +8,106 @@ This file is the entry point for FreeCAD. It imports the modular post-processor.
 
 import os
 import sys
-import importlib.util
-import glob
+import functools
 import shutil
 
+# Module directory, resolved once per session (cached on sys, keyed by __file__)
+_dir_flag = f"_woodwop_dir_{__file__}"
+_current_dir = getattr(sys, _dir_flag, None)
+if _current_dir is None:
+    _current_dir = os.path.dirname(os.path.abspath(__file__))
+    setattr(sys, _dir_flag, _current_dir)
+
 # Development mode: Auto-clean cache on module load
 # Set WOODWOP_DEV_MODE=1 environment variable to enable
 # Or create a file named .dev_mode in the module directory
-_current_dir = os.path.dirname(os.path.abspath(__file__))
-_dev_mode_file = os.path.join(_current_dir, '.dev_mode')
-_DEV_MODE = os.environ.get('WOODWOP_DEV_MODE', '0') == '1' or os.path.exists(_dev_mode_file)
+# The .dev_mode check is done once per session (cached on sys), and only
+# if the environment variable is not set; creating or deleting .dev_mode
+# therefore takes effect only after FreeCAD is restarted
+_DEV_MODE = os.environ.get('WOODWOP_DEV_MODE') == '1'
+if not _DEV_MODE:
+    _dev_mode_flag = f"_woodwop_dev_mode_{_current_dir}"
+    _DEV_MODE = getattr(sys, _dev_mode_flag, None)
+    if _DEV_MODE is None:
+        _DEV_MODE = os.path.exists(os.path.join(_current_dir, '.dev_mode'))
+        setattr(sys, _dev_mode_flag, _DEV_MODE)
 
 if _DEV_MODE:
     # Use a flag to ensure cache is cleaned only once per session
     _cache_cleaned_flag = f"_woodwop_cache_cleaned_{_current_dir}"
     if not hasattr(sys, _cache_cleaned_flag):
-        # Clean .pyc files
-        pyc_files = glob.glob(os.path.join(_current_dir, '*.pyc'))
-        for f in pyc_files:
-            try:
-                os.remove(f)
-            except (OSError, PermissionError):
-                pass
-        
-        # Clean __pycache__ directories
-        pycache_dirs = glob.glob(os.path.join(_current_dir, '__pycache__'))
-        for d in pycache_dirs:
-            try:
-                shutil.rmtree(d)
-            except (OSError, PermissionError):
-                pass
-        
-        # Also clean __pycache__ in subdirectories
-        for root, dirs, files in os.walk(_current_dir):
-            pycache_path = os.path.join(root, '__pycache__')
-            if os.path.exists(pycache_path):
-                try:
-                    shutil.rmtree(pycache_path)
-                except (OSError, PermissionError):
-                    pass
+        # Clean .pyc files and __pycache__ directories in a single bottom-up walk
+        for root, dirs, files in os.walk(_current_dir, topdown=False, followlinks=False):
+            if os.path.basename(root) == '__pycache__':
+                shutil.rmtree(root, ignore_errors=True)
+                continue
+            for name in files:
+                if name.endswith('.pyc'):
+                    try:
+                        os.remove(os.path.join(root, name))
+                    except OSError:
+                        pass
         
         # Remove only woodwop modules from sys.modules (but not woodwop_post itself to avoid recursion)
-        modules_to_remove = [
-            name for name in sys.modules.keys() 
-            if name.startswith('woodwop') and name != 'woodwop_post'
-        ]
-        for module_name in modules_to_remove:
-            try:
-                del sys.modules[module_name]
-            except KeyError:
-                pass
+        for module_name in list(sys.modules):
+            if module_name[:7] == 'woodwop' and module_name != 'woodwop_post':
+                sys.modules.pop(module_name, None)
         
         # Mark as cleaned
         setattr(sys, _cache_cleaned_flag, True)
         
-        try:
-            import FreeCAD  # noqa: F401
-            FreeCAD.Console.PrintMessage(f"[WoodWOP DEV] Cache cleaned in {_current_dir}\n")
-        except ImportError:
+        _freecad = sys.modules.get('FreeCAD')
+        if _freecad is not None:
+            _freecad.Console.PrintMessage(f"[WoodWOP DEV] Cache cleaned in {_current_dir}\n")
+        else:
             print(f"[WoodWOP DEV] Cache cleaned in {_current_dir}")
 
 # Add parent directory to path to allow importing from woodwop package
+# (once per session: the flag on sys skips the sys.path scan on re-import)
 # _current_dir already defined above for dev mode
-_parent_dir = os.path.dirname(_current_dir)
-if _parent_dir not in sys.path:
-    sys.path.insert(0, _parent_dir)
+_path_added_flag = f"_woodwop_path_added_{_current_dir}"
+if not getattr(sys, _path_added_flag, False):
+    _parent_dir = os.path.dirname(_current_dir)
+    if _parent_dir not in sys.path:
+        sys.path.insert(0, _parent_dir)
+    setattr(sys, _path_added_flag, True)
 
 # CRITICAL: Apply patches to Command.py automatically
 # The patch modules are self-contained and handle everything automatically
 # They will apply patches when FreeCAD modules become available
+@functools.cache
+def _load_command_patch():
+    """
+    Import command_patch once per session.
+    
+    command_patch.py lives next to this file; the import system reuses it
+    from sys.modules if it was already imported elsewhere.
+    
+    Returns:
+        module: command_patch module, or None if it is not available
+    """
+    patch_module = sys.modules.get('command_patch')
+    if patch_module is not None:
+        return patch_module
+    
+    import importlib
+    try:
+        return importlib.import_module('command_patch')
+    except ImportError:
+        return None
+
+
 def _ensure_command_patch():
     """Ensure patches are applied to Command.py when FreeCAD is available."""
     try:
-        import importlib.util
-        
         # Apply command_patch (for gcode type fix)
-        patch_path = os.path.join(_current_dir, 'command_patch.py')
-        if os.path.exists(patch_path):
-            spec = importlib.util.spec_from_file_location("command_patch", patch_path)
-            if spec and spec.loader:
-                patch_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(patch_module)
-                # Use ensure_patch_applied() which is safe to call multiple times
-                if hasattr(patch_module, 'ensure_patch_applied'):
-                    patch_module.ensure_patch_applied()
-                elif hasattr(patch_module, 'apply_patch'):
-                    patch_module.apply_patch()
-        
-        # Apply dialog_patch (for .mpr extension enforcement)
-        # TEMPORARILY DISABLED due to Qt import issues
-        # FreeCAD will use .mpr extension based on subpart='mpr' from export() return value
-        # dialog_patch_path = os.path.join(_current_dir, 'dialog_patch.py')
-        # if os.path.exists(dialog_patch_path):
-        #     spec = importlib.util.spec_from_file_location("dialog_patch", dialog_patch_path)
-        #     if spec and spec.loader:
-        #         dialog_patch_module = importlib.util.module_from_spec(spec)
-        #         spec.loader.exec_module(dialog_patch_module)
-        #         # Use ensure_dialog_patch_applied() which is safe to call multiple times
-        #         if hasattr(dialog_patch_module, 'ensure_dialog_patch_applied'):
-        #             dialog_patch_module.ensure_dialog_patch_applied()
-        #         elif hasattr(dialog_patch_module, 'apply_dialog_patch'):
-        #             dialog_patch_module.apply_dialog_patch()
+        patch_module = _load_command_patch()
+        if patch_module is not None:
+            # Prefer ensure_patch_applied() which is safe to call multiple times
+            apply_func = (getattr(patch_module, 'ensure_patch_applied', None)
+                          or getattr(patch_module, 'apply_patch', None))
+            if apply_func is not None:
+                apply_func()
         
         return True
     except Exception as e:
@@ -118,39 +117,50 @@ def _ensure_command_patch():
             FreeCAD.Console.PrintWarning(
                 f"WoodWOP: Failed to ensure Command.py patches: {e}\n"
             )
-        except:
+        except Exception:
             pass
     return False
 
 # Try to apply patch immediately (if FreeCAD is already loaded)
 # The patch module will handle this automatically, but we try here too
-try:
-    import FreeCAD
+# If FreeCAD is not loaded yet, the patch will be applied automatically when needed
+# (the patch module is self-contained and will apply itself when FreeCAD loads)
+if 'FreeCAD' in sys.modules:
     _ensure_command_patch()
-except:
-    # FreeCAD not loaded yet - patch will be applied automatically when needed
-    # The patch module is self-contained and will apply itself when FreeCAD loads
-    pass
-
-# Import from the modular structure
-# Direct import from same directory (FreeCAD loads this file directly)
-impl_path = os.path.join(_current_dir, 'woodwop_post_impl.py')
-if os.path.exists(impl_path):
-    spec = importlib.util.spec_from_file_location("woodwop_post_impl", impl_path)
-    if spec and spec.loader:
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
-        export = module.export
-        TOOLTIP = module.TOOLTIP
-        TOOLTIP_ARGS = module.TOOLTIP_ARGS
-        POSTPROCESSOR_FILE_NAME = module.POSTPROCESSOR_FILE_NAME
-        FILE_EXTENSION = module.FILE_EXTENSION
-        UNITS = module.UNITS
-        linenumber = module.linenumber
-    else:
-        raise ImportError("Could not load woodwop_post_impl module")
-else:
-    raise ImportError(f"woodwop_post_impl.py not found at {impl_path}")
 
 # Re-export for FreeCAD compatibility
 __all__ = ['export', 'TOOLTIP', 'TOOLTIP_ARGS', 'POSTPROCESSOR_FILE_NAME', 'FILE_EXTENSION', 'UNITS', 'linenumber']
+
+
+def _load_impl():
+    """
+    Import woodwop_post_impl (the modular implementation).
+    
+    woodwop_post_impl lives next to this file (FreeCAD loads this file from a
+    directory on sys.path); it is reused from sys.modules on re-import.
+    
+    Returns:
+        module: woodwop_post_impl module
+    """
+    module = sys.modules.get('woodwop_post_impl')
+    if module is None:
+        import importlib
+        try:
+            module = importlib.import_module('woodwop_post_impl')
+        except ImportError as e:
+            raise ImportError(f"Could not load woodwop_post_impl module: {e}")
+    return module
+
+
+def __getattr__(name):
+    """
+    Load the implementation on first access to one of the exported names (PEP 562).
+    
+    All exported names are copied into this module at once, so later accesses
+    are plain module attribute lookups.
+    """
+    if name in __all__:
+        module = _load_impl()
+        globals().update({export_name: getattr(module, export_name) for export_name in __all__})
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -6,6 +6,7 @@ This is the main implementation using modular structure.
 import os
 import sys
 import datetime
+import importlib.util
 
 # FreeCAD imports - only available inside FreeCAD
 # Import at module level to avoid "cannot access local variable" errors
@@ -62,6 +63,197 @@ FILE_EXTENSION = config.FILE_EXTENSION
 UNITS = config.UNITS
 
 
+def _as_str(content, sep):
+    """
+    Normalize generator output to a string.
+    
+    Args:
+        content: Generated content (str, list of lines, or None)
+        sep: Line separator used to join a list of lines
+        
+    Returns:
+        str: Content as a single string
+    """
+    if isinstance(content, str):
+        return content
+    if isinstance(content, list):
+        return sep.join(map(str, content))
+    return str(content) if content else ""
+
+
+# Timestamp source for config.now (bound once)
+_now = datetime.datetime.now
+
+# Sentinel for missing attributes (None/0.0 are valid attribute values)
+_MISSING = object()
+
+
+def _val(value):
+    """Return the plain number of a FreeCAD Quantity (or the value itself)."""
+    return value.Value if hasattr(value, 'Value') else value
+
+
+def _q(obj, name, default=None):
+    """
+    Read a (possibly Quantity) attribute as a plain value.
+    
+    Args:
+        obj: Object to read from
+        name: Attribute name
+        default: Value returned if the attribute does not exist
+        
+    Returns:
+        Attribute value (Quantity.Value for quantities), or default
+    """
+    value = getattr(obj, name, _MISSING)
+    return default if value is _MISSING else _val(value)
+
+
+# (config attribute, candidate Stock attributes) - first existing attribute wins
+_STOCK_FIELDS = (
+    ('STOCK_EXTENT_X_NEG', ('ExtentXNeg', 'ExtXneg')),
+    ('STOCK_EXTENT_X_POS', ('ExtentXPos', 'ExtXpos')),
+    ('STOCK_EXTENT_Y_NEG', ('ExtentYNeg', 'ExtYneg')),
+    ('STOCK_EXTENT_Y_POS', ('ExtentYPos', 'ExtYpos')),
+)
+
+# (config attribute, candidate Position/ProgramOffset attributes)
+_OFFSET_FIELDS = (
+    ('PROGRAM_OFFSET_X', ('x', 'X')),
+    ('PROGRAM_OFFSET_Y', ('y', 'Y')),
+    ('PROGRAM_OFFSET_Z', ('z', 'Z')),
+)
+
+
+def _apply_fields(source, fields):
+    """
+    Copy values from a FreeCAD object into config using a field table.
+    
+    Args:
+        source: Object to read attributes from (Stock, Position, ...)
+        fields: Tuple of (config attribute, candidate attribute names)
+    """
+    for config_name, candidates in fields:
+        for attr_name in candidates:
+            value = getattr(source, attr_name, _MISSING)
+            if value is not _MISSING:
+                setattr(config, config_name, _val(value))
+                break
+
+
+# Job attributes holding the model name, in order of preference
+_JOB_MODEL_ATTRS = ('Model', 'ModelName', 'модел')
+
+
+def _find_job(objects):
+    """
+    Find the Job object in a list of FreeCAD objects.
+    
+    Args:
+        objects: Iterable of FreeCAD objects
+        
+    Returns:
+        Job object or None if not found
+    """
+    for obj in objects:
+        proxy = getattr(obj, 'Proxy', None)
+        if proxy is not None and 'Job' in getattr(proxy, 'Type', ''):
+            return obj
+    return None
+
+
+def _bbox_of(candidate, shape_only=False):
+    """
+    Get bounding box dimensions of a FreeCAD object.
+    
+    Shape is a computed property in FreeCAD, so it is read only once.
+    
+    Args:
+        candidate: Object with Shape.BoundBox (or BoundBox)
+        shape_only: If True, ignore a BoundBox directly on the object
+        
+    Returns:
+        tuple or None: (XLength, YLength, ZLength), or None if no bounding box
+    """
+    shape = getattr(candidate, 'Shape', None)
+    bbox = getattr(shape, 'BoundBox', None) if shape is not None else None
+    if bbox is None and not shape_only:
+        bbox = getattr(candidate, 'BoundBox', None)
+    if bbox is None:
+        return None
+    return bbox.XLength, bbox.YLength, bbox.ZLength
+
+
+_WORKPIECE_DIMS = (
+    ('WORKPIECE_LENGTH', 'length'),
+    ('WORKPIECE_WIDTH', 'width'),
+    ('WORKPIECE_THICKNESS', 'thickness'),
+)
+
+
+def _workpiece_dims_missing():
+    """Return True if any workpiece dimension is still unknown."""
+    return (config.WORKPIECE_LENGTH is None or config.WORKPIECE_WIDTH is None
+            or config.WORKPIECE_THICKNESS is None)
+
+
+def _fill_workpiece_dims(dims, source):
+    """
+    Set the workpiece dimensions that are still unknown.
+    
+    Args:
+        dims: (length, width, thickness) tuple
+        source: Source name for the debug log ('Model', 'Base')
+    """
+    for (config_name, label), value in zip(_WORKPIECE_DIMS, dims):
+        if getattr(config, config_name) is None:
+            setattr(config, config_name, value)
+            utils.debug_log(f"[WoodWOP DEBUG] Detected workpiece {label} from {source}: {value:.3f} mm")
+
+
+def _base_filename_candidates(job_output_file, job_output_dir, job_model, part_name, filename):
+    """
+    Yield base filename candidates in order of preference.
+    
+    Candidates are computed lazily, so later ones are only evaluated if the
+    earlier ones are empty.
+    
+    Args:
+        job_output_file: Job.PostProcessorOutputFile (None if not set)
+        job_output_dir: Directory part of job_output_file ('' if none)
+        job_model: Job model name (or None)
+        part_name: Label of the Job base object (or None)
+        filename: Filename passed to export()
+        
+    Yields:
+        str: Candidate base filename (may be empty)
+    """
+    output_base = None
+    if job_output_file:
+        output_base = os.path.splitext(os.path.basename(job_output_file))[0]
+        # Output file with an explicit directory takes precedence
+        if job_output_dir and job_output_dir != '/' and job_output_dir != '.':
+            yield output_base
+    if job_model:
+        yield str(job_model).strip()
+    if part_name:
+        yield part_name.strip()
+    if output_base:
+        yield output_base
+    if filename and filename != '-':
+        if '.' in filename:
+            yield os.path.splitext(os.path.basename(filename))[0]
+        else:
+            yield os.path.basename(filename)
+
+
+# command_patch module, loaded by the first export() call and reused afterwards
+_command_patch_module = None
+_command_patch_checked = False
+# Set once command_patch has been applied; export() then skips the patch block
+_patches_ready = False
+
+
 def export(objectslist, filename, argstring):
     """
     Main export function called by FreeCAD.
@@ -76,58 +268,81 @@ def export(objectslist, filename, argstring):
     Returns:
         list: List of tuples [("mpr", content), ("nc", content)]
     """
+    try:
+        return _export(objectslist, filename, argstring)
+    finally:
+        # Do not keep Path objects and their commands alive between exports
+        path_parser.clear_cache()
+
+
+def _export(objectslist, filename, argstring):
+    """
+    Run one export; see export().
+    """
     # CRITICAL: Ensure patches are applied when export is called
     # This ensures FreeCAD modules are loaded and patches are applied
     # The patch modules are self-contained and handle everything automatically
-    try:
-        import importlib.util
-        _current_dir = os.path.dirname(os.path.abspath(__file__))
-        
-        # Apply command_patch (for gcode type fix)
-        patch_path = os.path.join(_current_dir, 'command_patch.py')
-        if os.path.exists(patch_path):
-            spec = importlib.util.spec_from_file_location("command_patch", patch_path)
-            if spec and spec.loader:
-                patch_module = importlib.util.module_from_spec(spec)
-                spec.loader.exec_module(patch_module)
-                # Use ensure_patch_applied() which is safe to call multiple times
+    global _command_patch_module, _command_patch_checked, _patches_ready
+    if not _patches_ready:
+        try:
+            # Look up command_patch (for gcode type fix) once; later calls reuse it.
+            # woodwop_post usually imported it already, so take that module from
+            # sys.modules instead of loading a second copy (_current_dir is on sys.path)
+            if not _command_patch_checked:
+                patch_module = sys.modules.get('command_patch')
+                if patch_module is None:
+                    try:
+                        patch_module = importlib.import_module('command_patch')
+                    except ImportError:
+                        patch_module = None
+                _command_patch_module = patch_module
+                _command_patch_checked = True
+            
+            # Apply command_patch; ensure_patch_applied() is safe to call multiple times
+            patch_module = _command_patch_module
+            applied = True
+            if patch_module is not None:
                 if hasattr(patch_module, 'ensure_patch_applied'):
-                    patch_module.ensure_patch_applied()
+                    applied = patch_module.ensure_patch_applied()
                 elif hasattr(patch_module, 'apply_patch'):
-                    patch_module.apply_patch()
-        
-        # Apply dialog_patch (for .mpr extension enforcement)
-        # TEMPORARILY DISABLED due to Qt import issues
-        # FreeCAD will use .mpr extension based on subpart='mpr' from export() return value
-        # dialog_patch_path = os.path.join(_current_dir, 'dialog_patch.py')
-        # if os.path.exists(dialog_patch_path):
-        #     spec = importlib.util.spec_from_file_location("dialog_patch", dialog_patch_path)
-        #     if spec and spec.loader:
-        #         dialog_patch_module = importlib.util.module_from_spec(spec)
-        #         spec.loader.exec_module(dialog_patch_module)
-        #         # Use ensure_dialog_patch_applied() which is safe to call multiple times
-        #         if hasattr(dialog_patch_module, 'ensure_dialog_patch_applied'):
-        #             dialog_patch_module.ensure_dialog_patch_applied()
-        #         elif hasattr(dialog_patch_module, 'apply_dialog_patch'):
-        #             dialog_patch_module.apply_dialog_patch()
-    except Exception as e:
-        # Patch failed - log but don't fail
-        try:
-            # Use global FreeCAD, don't import locally
-            if FreeCAD:
-                FreeCAD.Console.PrintWarning(
-                    f"WoodWOP: Failed to ensure Command.py patches in export(): {e}\n"
-                )
-        except:
-            pass
+                    applied = patch_module.apply_patch()
+            # Skip this block on later calls once the patch is in place
+            # (or there is no patch module); retry while it is not
+            _patches_ready = bool(applied)
+            
+            # Apply dialog_patch (for .mpr extension enforcement)
+            # TEMPORARILY DISABLED due to Qt import issues
+            # FreeCAD will use .mpr extension based on subpart='mpr' from export() return value
+            # dialog_patch_path = os.path.join(_current_dir, 'dialog_patch.py')
+            # if os.path.exists(dialog_patch_path):
+            #     spec = importlib.util.spec_from_file_location("dialog_patch", dialog_patch_path)
+            #     if spec and spec.loader:
+            #         dialog_patch_module = importlib.util.module_from_spec(spec)
+            #         spec.loader.exec_module(dialog_patch_module)
+            #         # Use ensure_dialog_patch_applied() which is safe to call multiple times
+            #         if hasattr(dialog_patch_module, 'ensure_dialog_patch_applied'):
+            #             dialog_patch_module.ensure_dialog_patch_applied()
+            #         elif hasattr(dialog_patch_module, 'apply_dialog_patch'):
+            #             dialog_patch_module.apply_dialog_patch()
+        except Exception as e:
+            # Patch failed - log but don't fail
+            try:
+                # Use global FreeCAD, don't import locally
+                if FreeCAD:
+                    FreeCAD.Console.PrintWarning(
+                        f"WoodWOP: Failed to ensure Command.py patches in export(): {e}\n"
+                    )
+            except Exception:
+                pass
     # Initialize config module
-    config.now = datetime.datetime.now()
+    config.now = _now()
     
     # Reset global state
     config.contour_counter = 1
     config.contours = []
     config.operations = []
     config.tools_used = set()
+    path_parser.clear_cache()
     
     # Parse arguments FIRST to set flags before any other operations
     argument_parser.parse_arguments(argstring)
@@ -137,30 +352,21 @@ def export(objectslist, filename, argstring):
     console_logger.initialize_console_logging()
     
     # Find Job object
-    job = None
     job_output_file = None
     job_model = None
     part_name = None
     
-    for obj in objectslist:
-        if hasattr(obj, 'Proxy') and hasattr(obj.Proxy, 'Type'):
-            if 'Job' in obj.Proxy.Type:
-                job = obj
-                if hasattr(obj, 'PostProcessorOutputFile'):
-                    job_output_file = obj.PostProcessorOutputFile
-                if hasattr(obj, 'Model'):
-                    job_model = obj.Model
-                elif hasattr(obj, 'ModelName'):
-                    job_model = obj.ModelName
-                elif hasattr(obj, 'модел'):
-                    job_model = obj.модел
-                if hasattr(obj, 'Base') and obj.Base:
-                    if hasattr(obj.Base, 'Label'):
-                        part_name = obj.Base.Label
-                    elif isinstance(obj.Base, (list, tuple)) and len(obj.Base) > 0:
-                        if hasattr(obj.Base[0], 'Label'):
-                            part_name = obj.Base[0].Label
-                break
+    job = _find_job(objectslist)
+    if job is not None:
+        job_output_file = getattr(job, 'PostProcessorOutputFile', None)
+        job_model = next((getattr(job, name) for name in _JOB_MODEL_ATTRS if hasattr(job, name)), None)
+        job_base = getattr(job, 'Base', None)
+        if job_base:
+            if hasattr(job_base, 'Label'):
+                part_name = job_base.Label
+            elif isinstance(job_base, (list, tuple)) and len(job_base) > 0:
+                if hasattr(job_base[0], 'Label'):
+                    part_name = job_base[0].Label
     
     # Also try to get Job from ActiveDocument if not found
     if not job and FreeCAD:
@@ -178,44 +384,21 @@ def export(objectslist, filename, argstring):
         except Exception as e:
             utils.debug_log(f"Could not access ActiveDocument: {e}")
     
-    # Determine base filename
-    base_filename = None
-    if job_output_file and job_output_file.strip():
-        dir_name = os.path.dirname(job_output_file)
-        if dir_name and dir_name != '/' and dir_name != '.':
-            base_name = os.path.splitext(os.path.basename(job_output_file))[0]
-            if base_name:
-                base_filename = base_name
-    
-    if not base_filename and job_model:
-        model_str = str(job_model).strip()
-        if model_str:
-            base_filename = model_str
-    
-    if not base_filename and part_name:
-        part_str = part_name.strip()
-        if part_str:
-            base_filename = part_str
-    
-    if not base_filename and job_output_file and job_output_file.strip():
-        base_name = os.path.splitext(os.path.basename(job_output_file))[0]
-        if base_name:
-            base_filename = base_name
-    
-    if not base_filename and filename and filename != '-':
-        if '.' in filename:
-            base_filename = os.path.splitext(os.path.basename(filename))[0]
-        else:
-            base_filename = os.path.basename(filename)
+    # Directory part of the Job output file ('' if not set or blank)
+    if job_output_file and not job_output_file.isspace():
+        job_output_dir = os.path.dirname(job_output_file)
+    else:
+        job_output_file = None
+        job_output_dir = ''
     
-    if not base_filename:
-        base_filename = "export"
+    # Determine base filename (first non-empty candidate wins)
+    base_filename = next(
+        (name for name in _base_filename_candidates(job_output_file, job_output_dir, job_model, part_name, filename) if name),
+        "export"
+    )
     
     # Get output directory
-    output_dir = None
-    if job_output_file and job_output_file.strip():
-        if os.path.dirname(job_output_file):
-            output_dir = os.path.dirname(os.path.abspath(job_output_file))
+    output_dir = os.path.abspath(job_output_dir) if job_output_dir else None
     
     if not output_dir:
         try:
@@ -237,163 +420,92 @@ def export(objectslist, filename, argstring):
     if job and hasattr(job, 'Stock') and job.Stock:
         stock = job.Stock
         try:
-            if config.WORKPIECE_LENGTH is None and hasattr(stock, 'Length'):
-                config.WORKPIECE_LENGTH = stock.Length.Value if hasattr(stock.Length, 'Value') else stock.Length
-            if config.WORKPIECE_WIDTH is None and hasattr(stock, 'Width'):
-                config.WORKPIECE_WIDTH = stock.Width.Value if hasattr(stock.Width, 'Value') else stock.Width
-            if config.WORKPIECE_THICKNESS is None and hasattr(stock, 'Height'):
-                config.WORKPIECE_THICKNESS = stock.Height.Value if hasattr(stock.Height, 'Value') else stock.Height
+            if config.WORKPIECE_LENGTH is None:
+                config.WORKPIECE_LENGTH = _q(stock, 'Length')
+            if config.WORKPIECE_WIDTH is None:
+                config.WORKPIECE_WIDTH = _q(stock, 'Width')
+            if config.WORKPIECE_THICKNESS is None:
+                config.WORKPIECE_THICKNESS = _q(stock, 'Height')
             
             # Get stock extents
-            if hasattr(stock, 'ExtentXNeg'):
-                config.STOCK_EXTENT_X_NEG = stock.ExtentXNeg.Value if hasattr(stock.ExtentXNeg, 'Value') else stock.ExtentXNeg
-            elif hasattr(stock, 'ExtXneg'):
-                config.STOCK_EXTENT_X_NEG = stock.ExtXneg.Value if hasattr(stock.ExtXneg, 'Value') else stock.ExtXneg
-            
-            if hasattr(stock, 'ExtentXPos'):
-                config.STOCK_EXTENT_X_POS = stock.ExtentXPos.Value if hasattr(stock.ExtentXPos, 'Value') else stock.ExtentXPos
-            elif hasattr(stock, 'ExtXpos'):
-                config.STOCK_EXTENT_X_POS = stock.ExtXpos.Value if hasattr(stock.ExtXpos, 'Value') else stock.ExtXpos
-            
-            if hasattr(stock, 'ExtentYNeg'):
-                config.STOCK_EXTENT_Y_NEG = stock.ExtentYNeg.Value if hasattr(stock.ExtentYNeg, 'Value') else stock.ExtentYNeg
-            elif hasattr(stock, 'ExtYneg'):
-                config.STOCK_EXTENT_Y_NEG = stock.ExtYneg.Value if hasattr(stock.ExtYneg, 'Value') else stock.ExtYneg
-            
-            if hasattr(stock, 'ExtentYPos'):
-                config.STOCK_EXTENT_Y_POS = stock.ExtentYPos.Value if hasattr(stock.ExtentYPos, 'Value') else stock.ExtentYPos
-            elif hasattr(stock, 'ExtYpos'):
-                config.STOCK_EXTENT_Y_POS = stock.ExtYpos.Value if hasattr(stock.ExtYpos, 'Value') else stock.ExtYpos
-            
+            _apply_fields(stock, _STOCK_FIELDS)
             config.STOCK_EXTENT_X = config.STOCK_EXTENT_X_NEG + config.STOCK_EXTENT_X_POS
             config.STOCK_EXTENT_Y = config.STOCK_EXTENT_Y_NEG + config.STOCK_EXTENT_Y_POS
             
             # Get program offsets
             if hasattr(stock, 'Position') and stock.Position:
-                pos = stock.Position
-                if hasattr(pos, 'x'):
-                    config.PROGRAM_OFFSET_X = pos.x.Value if hasattr(pos.x, 'Value') else pos.x
-                elif hasattr(pos, 'X'):
-                    config.PROGRAM_OFFSET_X = pos.X.Value if hasattr(pos.X, 'Value') else pos.X
-                if hasattr(pos, 'y'):
-                    config.PROGRAM_OFFSET_Y = pos.y.Value if hasattr(pos.y, 'Value') else pos.y
-                elif hasattr(pos, 'Y'):
-                    config.PROGRAM_OFFSET_Y = pos.Y.Value if hasattr(pos.Y, 'Value') else pos.Y
-                if hasattr(pos, 'z'):
-                    config.PROGRAM_OFFSET_Z = pos.z.Value if hasattr(pos.z, 'Value') else pos.z
-                elif hasattr(pos, 'Z'):
-                    config.PROGRAM_OFFSET_Z = pos.Z.Value if hasattr(pos.Z, 'Value') else pos.Z
+                _apply_fields(stock.Position, _OFFSET_FIELDS)
             elif hasattr(stock, 'ProgramOffset'):
-                prog_offset = stock.ProgramOffset
-                if hasattr(prog_offset, 'x'):
-                    config.PROGRAM_OFFSET_X = prog_offset.x.Value if hasattr(prog_offset.x, 'Value') else prog_offset.x
-                elif hasattr(prog_offset, 'X'):
-                    config.PROGRAM_OFFSET_X = prog_offset.X.Value if hasattr(prog_offset.X, 'Value') else prog_offset.X
-                if hasattr(prog_offset, 'y'):
-                    config.PROGRAM_OFFSET_Y = prog_offset.y.Value if hasattr(prog_offset.y, 'Value') else prog_offset.y
-                elif hasattr(prog_offset, 'Y'):
-                    config.PROGRAM_OFFSET_Y = prog_offset.Y.Value if hasattr(prog_offset.Y, 'Value') else prog_offset.Y
-                if hasattr(prog_offset, 'z'):
-                    config.PROGRAM_OFFSET_Z = prog_offset.z.Value if hasattr(prog_offset.z, 'Value') else prog_offset.z
-                elif hasattr(prog_offset, 'Z'):
-                    config.PROGRAM_OFFSET_Z = prog_offset.Z.Value if hasattr(prog_offset.Z, 'Value') else prog_offset.Z
+                _apply_fields(stock.ProgramOffset, _OFFSET_FIELDS)
         except Exception as e:
-            print(f"[WoodWOP DEBUG] Could not get dimensions from Stock: {e}")
+            utils.debug_log(f"[WoodWOP DEBUG] Could not get dimensions from Stock: {e}")
     
     # Second priority: Try to get dimensions from Job.Model (bounding box of actual part)
-    if job and (config.WORKPIECE_LENGTH is None or config.WORKPIECE_WIDTH is None or config.WORKPIECE_THICKNESS is None):
-        if hasattr(job, 'Model') and job.Model:
+    if job and _workpiece_dims_missing():
+        model_obj = getattr(job, 'Model', None)
+        if model_obj:
             try:
-                model_obj = job.Model
-                bbox = None
-                
-                # Try to get bounding box from Model
-                if hasattr(model_obj, 'Shape') and hasattr(model_obj.Shape, 'BoundBox'):
-                    bbox = model_obj.Shape.BoundBox
-                elif hasattr(model_obj, 'BoundBox'):
-                    bbox = model_obj.BoundBox
-                elif isinstance(model_obj, (list, tuple)) and len(model_obj) > 0:
+                dims = _bbox_of(model_obj)
+                if dims is None and isinstance(model_obj, (list, tuple)) and len(model_obj) > 0:
                     # Model might be a list of objects
-                    first_obj = model_obj[0]
-                    if hasattr(first_obj, 'Shape') and hasattr(first_obj.Shape, 'BoundBox'):
-                        bbox = first_obj.Shape.BoundBox
-                    elif hasattr(first_obj, 'BoundBox'):
-                        bbox = first_obj.BoundBox
-                
-                if bbox:
-                    if config.WORKPIECE_LENGTH is None:
-                        config.WORKPIECE_LENGTH = bbox.XLength
-                        print(f"[WoodWOP DEBUG] Detected workpiece length from Model: {config.WORKPIECE_LENGTH:.3f} mm")
-                    if config.WORKPIECE_WIDTH is None:
-                        config.WORKPIECE_WIDTH = bbox.YLength
-                        print(f"[WoodWOP DEBUG] Detected workpiece width from Model: {config.WORKPIECE_WIDTH:.3f} mm")
-                    if config.WORKPIECE_THICKNESS is None:
-                        config.WORKPIECE_THICKNESS = bbox.ZLength
-                        print(f"[WoodWOP DEBUG] Detected workpiece thickness from Model: {config.WORKPIECE_THICKNESS:.3f} mm")
+                    dims = _bbox_of(model_obj[0])
+                if dims:
+                    _fill_workpiece_dims(dims, 'Model')
             except Exception as e:
-                print(f"[WoodWOP DEBUG] Could not get dimensions from Model: {e}")
+                utils.debug_log(f"[WoodWOP DEBUG] Could not get dimensions from Model: {e}")
     
     # Third priority: Try to get dimensions from Job.Base (bounding box)
-    if job and (config.WORKPIECE_LENGTH is None or config.WORKPIECE_WIDTH is None or config.WORKPIECE_THICKNESS is None):
-        if hasattr(job, 'Base') and job.Base:
+    if job and _workpiece_dims_missing():
+        job_base = getattr(job, 'Base', None)
+        if job_base:
             try:
                 base_obj = None
-                if isinstance(job.Base, (list, tuple)) and len(job.Base) > 0:
-                    base_obj = job.Base[0]
-                elif hasattr(job.Base, 'Shape'):
-                    base_obj = job.Base
-                elif hasattr(job.Base, 'Name'):
+                if isinstance(job_base, (list, tuple)) and len(job_base) > 0:
+                    base_obj = job_base[0]
+                elif hasattr(job_base, 'Shape'):
+                    base_obj = job_base
+                elif hasattr(job_base, 'Name'):
                     try:
                         # Use global FreeCAD imported at module level
                         if FreeCAD:
                             doc = FreeCAD.ActiveDocument
                             if doc:
-                                base_obj = doc.getObject(job.Base.Name)
+                                base_obj = doc.getObject(job_base.Name)
                     except:
                         pass
                 
-                if base_obj and hasattr(base_obj, 'Shape') and hasattr(base_obj.Shape, 'BoundBox'):
-                    bbox = base_obj.Shape.BoundBox
-                    if config.WORKPIECE_LENGTH is None:
-                        config.WORKPIECE_LENGTH = bbox.XLength
-                        print(f"[WoodWOP DEBUG] Detected workpiece length from Base: {config.WORKPIECE_LENGTH:.3f} mm")
-                    if config.WORKPIECE_WIDTH is None:
-                        config.WORKPIECE_WIDTH = bbox.YLength
-                        print(f"[WoodWOP DEBUG] Detected workpiece width from Base: {config.WORKPIECE_WIDTH:.3f} mm")
-                    if config.WORKPIECE_THICKNESS is None:
-                        config.WORKPIECE_THICKNESS = bbox.ZLength
-                        print(f"[WoodWOP DEBUG] Detected workpiece thickness from Base: {config.WORKPIECE_THICKNESS:.3f} mm")
+                dims = _bbox_of(base_obj, shape_only=True) if base_obj is not None else None
+                if dims:
+                    _fill_workpiece_dims(dims, 'Base')
             except Exception as e:
-                print(f"[WoodWOP DEBUG] Could not get dimensions from Base: {e}")
+                utils.debug_log(f"[WoodWOP DEBUG] Could not get dimensions from Base: {e}")
     
     # Set defaults if still None
     if config.WORKPIECE_LENGTH is None:
         config.WORKPIECE_LENGTH = 800.0
-        print(f"[WoodWOP DEBUG] Using default workpiece length: {config.WORKPIECE_LENGTH:.3f} mm")
+        utils.debug_log(f"[WoodWOP DEBUG] Using default workpiece length: {config.WORKPIECE_LENGTH:.3f} mm")
     if config.WORKPIECE_WIDTH is None:
         config.WORKPIECE_WIDTH = 600.0
-        print(f"[WoodWOP DEBUG] Using default workpiece width: {config.WORKPIECE_WIDTH:.3f} mm")
+        utils.debug_log(f"[WoodWOP DEBUG] Using default workpiece width: {config.WORKPIECE_WIDTH:.3f} mm")
     if config.WORKPIECE_THICKNESS is None:
         config.WORKPIECE_THICKNESS = 20.0
-        print(f"[WoodWOP DEBUG] Using default workpiece thickness: {config.WORKPIECE_THICKNESS:.3f} mm")
+        utils.debug_log(f"[WoodWOP DEBUG] Using default workpiece thickness: {config.WORKPIECE_THICKNESS:.3f} mm")
     
     # Check Work Coordinate Systems (Fixtures) from Job
-    if job and hasattr(job, 'Fixtures') and job.Fixtures:
-        fixtures_list = job.Fixtures
+    # (Fixtures is read once: each access converts the FreeCAD property to a new list)
+    fixtures_list = getattr(job, 'Fixtures', None) if job else None
+    if fixtures_list:
         if 'G54' in fixtures_list:
             config.COORDINATE_SYSTEM = 'G54'
-        elif len(fixtures_list) > 0:
-            first_fixture = fixtures_list[0]
-            if first_fixture.startswith('G5'):
-                config.COORDINATE_SYSTEM = first_fixture
+        elif fixtures_list[0].startswith('G5'):
+            config.COORDINATE_SYSTEM = fixtures_list[0]
     
     # Process all path objects to extract contours and operations
-    path_objects_count = 0
-    for obj in objectslist:
-        if not hasattr(obj, "Path"):
-            continue
-        path_objects_count += 1
-        job_processor.process_path_object(obj)
+    process_path_object = job_processor.process_path_object
+    path_objects = [obj for obj in objectslist if hasattr(obj, "Path")]
+    path_objects_count = len(path_objects)
+    for obj in path_objects:
+        process_path_object(obj)
     
     print(f"[WoodWOP] Processed {path_objects_count} path objects")
     print(f"[WoodWOP] Total contours created: {len(config.contours)}")
@@ -411,23 +523,19 @@ def export(objectslist, filename, argstring):
             config.COORDINATE_OFFSET_Z = -min_z
         else:
             config.COORDINATE_OFFSET_Z = 0.0
-            print(f"[WoodWOP DEBUG] USE_Z_PART enabled: Z offset set to 0.0 (Z coordinates from Job without correction)")
-        print(f"[WoodWOP DEBUG] G54 offset: X={config.COORDINATE_OFFSET_X:.3f}, Y={config.COORDINATE_OFFSET_Y:.3f}, Z={config.COORDINATE_OFFSET_Z:.3f}")
+            utils.debug_log(f"[WoodWOP DEBUG] USE_Z_PART enabled: Z offset set to 0.0 (Z coordinates from Job without correction)")
+        utils.debug_log(f"[WoodWOP DEBUG] G54 offset: X={config.COORDINATE_OFFSET_X:.3f}, Y={config.COORDINATE_OFFSET_Y:.3f}, Z={config.COORDINATE_OFFSET_Z:.3f}")
     
     # Calculate z_safe from SetupSheet
     z_safe = 20.0
     if job and hasattr(job, 'SetupSheet'):
         try:
-            setup_sheet = job.SetupSheet
-            if hasattr(setup_sheet, 'ClearanceHeightOffset'):
-                clearance_offset = setup_sheet.ClearanceHeightOffset
-                if hasattr(clearance_offset, 'Value'):
-                    z_safe = float(clearance_offset.Value)
-                else:
-                    z_safe = float(clearance_offset)
-                print(f"[WoodWOP DEBUG] z_safe from SetupSheet.ClearanceHeightOffset: {z_safe:.3f} mm")
+            clearance_offset = _q(job.SetupSheet, 'ClearanceHeightOffset', _MISSING)
+            if clearance_offset is not _MISSING:
+                z_safe = float(clearance_offset)
+                utils.debug_log(f"[WoodWOP DEBUG] z_safe from SetupSheet.ClearanceHeightOffset: {z_safe:.3f} mm")
         except Exception as e:
-            print(f"[WoodWOP DEBUG] Could not get z_safe from SetupSheet: {e}")
+            utils.debug_log(f"[WoodWOP DEBUG] Could not get z_safe from SetupSheet: {e}")
     
     # Apply 20mm minimum unless /no_z_safe20 is used
     if not config.ENABLE_NO_Z_SAFE20 and z_safe < 20.0:
@@ -454,40 +562,15 @@ def export(objectslist, filename, argstring):
             # Console-only mode
             print(f"[WoodWOP] Use /no_z_safe20 flag to disable 20mm minimum check.")
     
-    # Generate MPR content
-    mpr_content = mpr_generator.generate_mpr_content(z_safe)
-    
-    # CRITICAL: Ensure mpr_content is a string, not a list
-    if not isinstance(mpr_content, str):
-        print(f"[WoodWOP CRITICAL ERROR] mpr_content is not a string! Type: {type(mpr_content)}")
-        print(f"[WoodWOP CRITICAL ERROR] mpr_content value (first 200 chars): {str(mpr_content)[:200]}")
-        if isinstance(mpr_content, list):
-            print(f"[WoodWOP CRITICAL ERROR] mpr_content is a list with {len(mpr_content)} items")
-            # Convert list to string using CRLF for MPR format
-            mpr_content = '\r\n'.join(str(item) for item in mpr_content)
-            print(f"[WoodWOP CRITICAL ERROR] Converted list to string, length: {len(mpr_content)}")
-        else:
-            mpr_content = str(mpr_content) if mpr_content else ""
-            print(f"[WoodWOP CRITICAL ERROR] Converted to string, length: {len(mpr_content)}")
-    
-    # Final check - MUST be string
-    if not isinstance(mpr_content, str):
-        print(f"[WoodWOP CRITICAL ERROR] mpr_content is STILL not a string after conversion! Type: {type(mpr_content)}")
-        mpr_content = str(mpr_content) if mpr_content else ""
-    
-    print(f"[WoodWOP DEBUG] mpr_content final type: {type(mpr_content).__name__}, length: {len(mpr_content)}")
+    # Generate MPR content (MPR format uses CRLF line endings)
+    mpr_content = _as_str(mpr_generator.generate_mpr_content(z_safe), '\r\n')
+    if not mpr_content:
+        print("[WoodWOP WARNING] MPR content is empty!")
     
     # Generate G-code if requested
     gcode_content = None
     if config.OUTPUT_NC_FILE:
-        gcode_content = gcode_generator.generate_gcode(objectslist)
-        # CRITICAL: Ensure gcode_content is a string, not a list
-        if not isinstance(gcode_content, str):
-            print(f"[WoodWOP ERROR] gcode_content is not a string! Type: {type(gcode_content)}")
-            if isinstance(gcode_content, list):
-                gcode_content = '\n'.join(gcode_content)
-            else:
-                gcode_content = str(gcode_content) if gcode_content else ""
+        gcode_content = _as_str(gcode_generator.generate_gcode(objectslist), '\n')
     
     # Create job report if requested
     if config.ENABLE_JOB_REPORT and job:
@@ -505,97 +588,16 @@ def export(objectslist, filename, argstring):
         except Exception as e:
             print(f"[WoodWOP WARNING] Failed to export path commands: {e}")
     
-    # Return results - CRITICAL: content must be strings, not lists
-    # Build result list with guaranteed string content
-    result = []
-    
-    # CRITICAL: Force convert mpr_content to string before adding
-    if isinstance(mpr_content, list):
-        print(f"[WoodWOP CRITICAL ERROR] mpr_content is STILL a list before adding to result! Converting...")
-        mpr_content = '\r\n'.join(str(item) for item in mpr_content)
-    elif not isinstance(mpr_content, str):
-        print(f"[WoodWOP CRITICAL ERROR] mpr_content is not a string before adding to result! Type: {type(mpr_content)}, converting...")
-        mpr_content = str(mpr_content) if mpr_content else ""
-    
-    # Add MPR content (guaranteed to be string after checks above)
-    result.append(("mpr", mpr_content))
-    
-    # Add G-code content if requested (guaranteed to be string after checks above)
+    # Return results: FreeCAD expects (subpart, str) tuples with 'mpr' first;
+    # both contents are already strings (normalized by _as_str())
+    final_result = [("mpr", mpr_content)]
     if gcode_content:
-        # CRITICAL: Force convert gcode_content to string before adding
-        if isinstance(gcode_content, list):
-            print(f"[WoodWOP CRITICAL ERROR] gcode_content is STILL a list before adding to result! Converting...")
-            gcode_content = '\n'.join(str(item) for item in gcode_content)
-        elif not isinstance(gcode_content, str):
-            print(f"[WoodWOP CRITICAL ERROR] gcode_content is not a string before adding to result! Type: {type(gcode_content)}, converting...")
-            gcode_content = str(gcode_content) if gcode_content else ""
-        result.append(("nc", gcode_content))
-    
-    # Final validation: ensure all content is string (triple-check)
-    for idx, (subpart, content) in enumerate(result):
-        # CRITICAL: Check type BEFORE any operations
-        if not isinstance(content, str):
-            print(f"[WoodWOP CRITICAL ERROR] result[{idx}] content is not a string! Type: {type(content)}, value: {repr(content)[:200]}")
-            # Force conversion to string
-            if isinstance(content, list):
-                print(f"[WoodWOP CRITICAL ERROR] result[{idx}] content is a list with {len(content)} items, converting to string...")
-                content = '\r\n'.join(str(item) for item in content) if subpart == 'mpr' else '\n'.join(str(item) for item in content)
-            else:
-                content = str(content) if content else ""
-            result[idx] = (subpart, content)
-            print(f"[WoodWOP CRITICAL ERROR] After conversion: type={type(content).__name__}, length={len(content)}")
-        # Verify it's not empty
-        if len(content) == 0:
-            print(f"[WoodWOP WARNING] result[{idx}] content is empty string!")
-    
-    # Final debug output with type verification
-    print(f"[WoodWOP DEBUG] Returning result: {len(result)} items")
-    for idx, (subpart, content) in enumerate(result):
-        content_type = type(content).__name__
-        content_len = len(content) if content else 0
-        is_string = isinstance(content, str)
-        print(f"[WoodWOP DEBUG]   result[{idx}]: subpart='{subpart}', content type={content_type}, length={content_len}, is_string={is_string}")
-        # CRITICAL: Ensure subpart is 'mpr' for MPR files (not 'nc')
-        if idx == 0 and subpart != 'mpr':
-            print(f"[WoodWOP WARNING] First subpart is '{subpart}', should be 'mpr'! Fixing...")
-            result[idx] = ('mpr', content)
-            subpart = 'mpr'
-        if not is_string:
-            print(f"[WoodWOP CRITICAL ERROR] result[{idx}] content is STILL not a string after all conversions!")
-            print(f"[WoodWOP CRITICAL ERROR] Content value (first 500 chars): {repr(content)[:500]}")
-            # Last resort: force conversion
-            if isinstance(content, list):
-                content = '\r\n'.join(str(item) for item in content) if subpart == 'mpr' else '\n'.join(str(item) for item in content)
-            else:
-                content = str(content) if content else ""
-            result[idx] = (subpart, content)
-            print(f"[WoodWOP CRITICAL ERROR] Final conversion: type={type(content).__name__}, length={len(content)}")
-    
-    # ABSOLUTE FINAL CHECK: Verify every item is a tuple with string content
-    final_result = []
-    for idx, item in enumerate(result):
-        if not isinstance(item, tuple) or len(item) != 2:
-            print(f"[WoodWOP CRITICAL ERROR] result[{idx}] is not a tuple of 2 elements! Type: {type(item)}, value: {item}")
-            continue
-        subpart, content = item
-        # CRITICAL: Ensure first item has subpart='mpr' for MPR files
-        if idx == 0 and subpart != 'mpr':
-            print(f"[WoodWOP WARNING] First subpart is '{subpart}', should be 'mpr'! Fixing...")
-            subpart = 'mpr'
-        if not isinstance(content, str):
-            print(f"[WoodWOP CRITICAL ERROR] FINAL CHECK: result[{idx}] content is not a string! Type: {type(content)}")
-            if isinstance(content, list):
-                content = '\r\n'.join(str(item) for item in content) if subpart == 'mpr' else '\n'.join(str(item) for item in content)
-            else:
-                content = str(content) if content else ""
-        final_result.append((subpart, content))
-    
-    print(f"[WoodWOP DEBUG] Final result: {len(final_result)} items, all verified as strings")
-    for idx, (subpart, content) in enumerate(final_result):
-        print(f"[WoodWOP DEBUG]   final_result[{idx}]: subpart='{subpart}', content length={len(content)}")
+        final_result.append(("nc", gcode_content))
+    if config.ENABLE_VERBOSE_LOGGING:
+        utils.debug_log(f"[WoodWOP DEBUG] Returning {len(final_result)} parts: "
+                        + ", ".join(f"{subpart}({len(content)} chars)" for subpart, content in final_result))
     return final_result
 
 
-def linenumber():
-    """Not used in MPR format."""
-    return utils.linenumber()
+# Not used in MPR format (FreeCAD interface, shared with utils)
+linenumber = utils.linenumber